@@ -1,6 +1,7 @@
 """Filter and search service for mailbox inventory."""
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, fields
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any
 
 from src.data.models import InactiveMailbox
@@ -12,7 +13,7 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class FilterCriteria:
     """Criteria for filtering mailboxes."""
 
@@ -42,20 +43,7 @@ class FilterCriteria:
 
     def is_empty(self) -> bool:
         """Check if no criteria are set."""
-        return all(
-            [
-                self.hold_types is None,
-                self.has_any_hold is None,
-                self.age_min_days is None,
-                self.age_max_days is None,
-                self.license_types is None,
-                self.operating_companies is None,
-                self.size_min_mb is None,
-                self.size_max_mb is None,
-                self.recovery_eligible is None,
-                self.search_query is None,
-            ]
-        )
+        return _criteria_values(self) == _EMPTY_CRITERIA_VALUES
 
     def to_dict(self) -> dict[str, Any]:
         """Convert criteria to dictionary for logging/export."""
@@ -75,6 +63,11 @@ class FilterCriteria:
         }
 
 
+# Field values of a default FilterCriteria, compared against in one tuple comparison
+_criteria_values = attrgetter(*(f.name for f in fields(FilterCriteria)))
+_EMPTY_CRITERIA_VALUES = _criteria_values(FilterCriteria())
+
+
 @dataclass
 class SortCriteria:
     """Criteria for sorting mailbox results."""
@@ -6,6 +6,7 @@ and initial configuration file generation.
 """
 
 import os
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
@@ -13,6 +14,11 @@ from typing import Any, Callable
 
 import yaml
 
+# GUID/UUID in canonical 8-4-4-4-12 hex form
+_GUID_RE = re.compile(
+    r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", re.IGNORECASE
+)
+
 
 class OnboardingStep(Enum):
     """Steps in the onboarding wizard."""
@@ -139,6 +145,39 @@ STEPS: dict[OnboardingStep, StepInfo] = {
 }
 
 
+_STEP_ORDER = tuple(OnboardingStep)
+
+# 1-based position of each step, for progress reporting
+_STEP_POSITIONS: dict[OnboardingStep, int] = {
+    step: idx for idx, step in enumerate(_STEP_ORDER, start=1)
+}
+
+# Candidate steps with their skip conditions, nearest first
+_StepCandidates = tuple[tuple[OnboardingStep, Callable[[OnboardingState], bool] | None], ...]
+
+# Steps after/before each step, precomputed so navigation needs no index search
+_FOLLOWING_STEPS: dict[OnboardingStep, _StepCandidates] = {
+    step: tuple((s, STEPS[s].skip_condition) for s in _STEP_ORDER[idx + 1 :])
+    for idx, step in enumerate(_STEP_ORDER)
+}
+_PRECEDING_STEPS: dict[OnboardingStep, _StepCandidates] = {
+    step: tuple((s, STEPS[s].skip_condition) for s in reversed(_STEP_ORDER[:idx]))
+    for idx, step in enumerate(_STEP_ORDER)
+}
+
+# Validator for each field, taking the wizard and the field's current value
+_FIELD_VALIDATORS: dict[str, Callable[["OnboardingWizard", Any], str | None]] = {
+    "organization": lambda wizard, value: wizard._validate_organization(value),
+    "tenant_id": lambda wizard, value: wizard._validate_guid(value, "Tenant ID"),
+    "client_id": lambda wizard, value: wizard._validate_guid(value, "Application ID"),
+    "certificate_path": lambda wizard, value: wizard._validate_certificate_path(value),
+    "client_secret": lambda wizard, value: wizard._validate_required(value, "Client Secret"),
+    "e5_cost": lambda wizard, value: wizard._validate_cost(value, "E5"),
+    "e3_cost": lambda wizard, value: wizard._validate_cost(value, "E3"),
+    "f3_cost": lambda wizard, value: wizard._validate_cost(value, "F3"),
+}
+
+
 class OnboardingWizard:
     """
     Wizard to guide users through initial setup.
@@ -149,7 +188,6 @@ class OnboardingWizard:
     def __init__(self, config_path: str = "config.yaml") -> None:
         self._config_path = Path(config_path)
         self._state = OnboardingState()
-        self._step_order = list(OnboardingStep)
 
     @property
     def state(self) -> OnboardingState:
@@ -174,8 +212,7 @@ class OnboardingWizard:
     @property
     def progress(self) -> tuple[int, int]:
         """Get progress as (current, total)."""
-        current_idx = self._step_order.index(self._state.current_step)
-        return current_idx + 1, len(self._step_order)
+        return _STEP_POSITIONS[self._state.current_step], len(_STEP_ORDER)
 
     def is_first_run(self) -> bool:
         """Check if this is the first run (no config exists)."""
@@ -243,37 +280,22 @@ class OnboardingWizard:
 
         Returns list of validation errors (empty if valid).
         """
-        errors: list[str] = []
-        step = self._state.current_step
-        info = STEPS[step]
-
-        for field in info.fields:
-            error = self._validate_field(field)
-            if error:
-                errors.append(error)
+        validate = self._validate_field
+        errors = [
+            error
+            for field in STEPS[self._state.current_step].fields
+            if (error := validate(field))
+        ]
 
         self._state.errors = errors
         return errors
 
     def _validate_field(self, field: str) -> str | None:
         """Validate a single field."""
-        value = getattr(self._state, field, None)
-
-        validators: dict[str, Callable[[], str | None]] = {
-            "organization": lambda: self._validate_organization(value),
-            "tenant_id": lambda: self._validate_guid(value, "Tenant ID"),
-            "client_id": lambda: self._validate_guid(value, "Application ID"),
-            "certificate_path": lambda: self._validate_certificate_path(value),
-            "client_secret": lambda: self._validate_required(value, "Client Secret"),
-            "e5_cost": lambda: self._validate_cost(value, "E5"),
-            "e3_cost": lambda: self._validate_cost(value, "E3"),
-            "f3_cost": lambda: self._validate_cost(value, "F3"),
-        }
-
-        validator = validators.get(field)
-        if validator:
-            return validator()
-        return None
+        validator = _FIELD_VALIDATORS.get(field)
+        if validator is None:
+            return None
+        return validator(self, getattr(self._state, field, None))
 
     def _validate_organization(self, value: str) -> str | None:
         """Validate organization domain."""
@@ -287,9 +309,7 @@ class OnboardingWizard:
         """Validate a GUID/UUID format."""
         if not value:
             return f"{name} is required"
-        # Basic GUID format check
-        value = value.strip().lower()
-        if len(value) != 36 or value.count("-") != 4:
+        if not _GUID_RE.fullmatch(value.strip()):
             return f"{name} should be a valid GUID"
         return None
 
@@ -325,15 +345,9 @@ class OnboardingWizard:
 
         Skips steps that don't apply based on current state.
         """
-        current_idx = self._step_order.index(self._state.current_step)
-
-        while current_idx < len(self._step_order) - 1:
-            current_idx += 1
-            next_step = self._step_order[current_idx]
-            info = STEPS[next_step]
-
+        for next_step, skip_condition in _FOLLOWING_STEPS[self._state.current_step]:
             # Check if this step should be skipped
-            if info.skip_condition and info.skip_condition(self._state):
+            if skip_condition and skip_condition(self._state):
                 continue
 
             self._state.current_step = next_step
@@ -348,15 +362,9 @@ class OnboardingWizard:
 
         Skips steps that don't apply based on current state.
         """
-        current_idx = self._step_order.index(self._state.current_step)
-
-        while current_idx > 0:
-            current_idx -= 1
-            prev_step = self._step_order[current_idx]
-            info = STEPS[prev_step]
-
+        for prev_step, skip_condition in _PRECEDING_STEPS[self._state.current_step]:
             # Check if this step should be skipped
-            if info.skip_condition and info.skip_condition(self._state):
+            if skip_condition and skip_condition(self._state):
                 continue
 
             self._state.current_step = prev_step
@@ -30,6 +30,7 @@ class ValidationCode(Enum):
     AUXPRIMARY_SHARD = "AUXPRIMARY_SHARD"
     UPN_CONFLICT = "UPN_CONFLICT"
     SMTP_CONFLICT = "SMTP_CONFLICT"
+    INVALID_SMTP = "INVALID_SMTP"
     MAILBOX_NOT_FOUND = "MAILBOX_NOT_FOUND"
     NOT_INACTIVE = "NOT_INACTIVE"
 
@@ -549,7 +550,17 @@ class RecoveryValidator:
         if not self._session.connection or not self._session.connection.is_connected:
             return None
 
-        cmd = self._command_builder.build_check_smtp_exists(target_smtp)
+        try:
+            cmd = self._command_builder.build_check_smtp_exists(target_smtp)
+        except ValueError:
+            return ValidationIssue(
+                code=ValidationCode.INVALID_SMTP,
+                message=f"Invalid SMTP address: {target_smtp}",
+                severity=ValidationSeverity.ERROR,
+                resolution="Enter a valid email address (e.g., user@contoso.com)",
+                details={"invalid_smtp": target_smtp},
+            )
+
         result = self._session.connection.execute_command(cmd, timeout=30)
 
         if result.success and result.output.strip():
@@ -1,7 +1,7 @@
 """Statistics service for mailbox inventory aggregations."""
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 from src.utils.logging import get_logger
 
@@ -11,9 +11,12 @@ if TYPE_CHECKING:
 logger = get_logger(__name__)
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class SummaryStats:
-    """Summary statistics for the mailbox inventory."""
+    """Summary statistics for the mailbox inventory.
+
+    Percentages are derived once from the counts at construction time.
+    """
 
     total_mailboxes: int = 0
     with_holds: int = 0
@@ -25,20 +28,19 @@ class SummaryStats:
     avg_age_days: float = 0.0
     oldest_mailbox_days: int = 0
     newest_mailbox_days: int = 0
+    hold_percentage: float = field(init=False)
+    recovery_percentage: float = field(init=False)
 
-    @property
-    def hold_percentage(self) -> float:
-        """Percentage of mailboxes with holds."""
-        if self.total_mailboxes == 0:
-            return 0.0
-        return (self.with_holds / self.total_mailboxes) * 100
-
-    @property
-    def recovery_percentage(self) -> float:
-        """Percentage of mailboxes eligible for recovery."""
-        if self.total_mailboxes == 0:
-            return 0.0
-        return (self.recovery_eligible / self.total_mailboxes) * 100
+    def __post_init__(self) -> None:
+        total = self.total_mailboxes
+        object.__setattr__(
+            self, "hold_percentage", (self.with_holds / total) * 100 if total else 0.0
+        )
+        object.__setattr__(
+            self,
+            "recovery_percentage",
+            (self.recovery_eligible / total) * 100 if total else 0.0,
+        )
 
 
 class StatisticsService:
@@ -81,16 +83,16 @@ class StatisticsService:
         Returns:
             SummaryStats with aggregated data
         """
-        stats = SummaryStats()
+        counts: dict[str, Any] = {}
 
         # Get total count
         result = self._db.execute_query(
             "SELECT COUNT(*) as count FROM inactive_mailboxes", []
         )
-        stats.total_mailboxes = result[0]["count"] if result else 0
+        total = result[0]["count"] if result else 0
 
-        if stats.total_mailboxes == 0:
-            return stats
+        if total == 0:
+            return SummaryStats()
 
         # Get hold counts
         result = self._db.execute_query(
@@ -103,8 +105,8 @@ class StatisticsService:
             [],
         )
         if result:
-            stats.with_holds = result[0]["with_holds"] or 0
-            stats.without_holds = result[0]["without_holds"] or 0
+            counts["with_holds"] = result[0]["with_holds"] or 0
+            counts["without_holds"] = result[0]["without_holds"] or 0
 
         # Get recovery eligibility counts
         result = self._db.execute_query(
@@ -117,8 +119,8 @@ class StatisticsService:
             [],
         )
         if result:
-            stats.recovery_eligible = result[0]["eligible"] or 0
-            stats.recovery_blocked = result[0]["blocked"] or 0
+            counts["recovery_eligible"] = result[0]["eligible"] or 0
+            counts["recovery_blocked"] = result[0]["blocked"] or 0
 
         # Get size and item totals
         result = self._db.execute_query(
@@ -132,8 +134,8 @@ class StatisticsService:
         )
         if result:
             total_mb = result[0]["total_size_mb"] or 0
-            stats.total_size_gb = total_mb / 1024
-            stats.total_items = result[0]["total_items"] or 0
+            counts["total_size_gb"] = total_mb / 1024
+            counts["total_items"] = result[0]["total_items"] or 0
 
         # Get age statistics
         result = self._db.execute_query(
@@ -147,11 +149,11 @@ class StatisticsService:
             [],
         )
         if result:
-            stats.avg_age_days = result[0]["avg_age"] or 0
-            stats.oldest_mailbox_days = result[0]["oldest"] or 0
-            stats.newest_mailbox_days = result[0]["newest"] or 0
+            counts["avg_age_days"] = result[0]["avg_age"] or 0
+            counts["oldest_mailbox_days"] = result[0]["oldest"] or 0
+            counts["newest_mailbox_days"] = result[0]["newest"] or 0
 
-        return stats
+        return SummaryStats(total_mailboxes=total, **counts)
 
     def get_stats_by_hold_type(self) -> dict[str, int]:
         """Get mailbox count by hold type.
@@ -3,6 +3,26 @@
 import re
 from typing import Any
 
+# Validation patterns for custom command construction; always applied with
+# fullmatch, since "$" would also accept a trailing newline
+_CMDLET_RE = re.compile(r"[A-Za-z]+-[A-Za-z]+")
+_PARAM_RE = re.compile(r"[A-Za-z][A-Za-z0-9]*")
+_SMTP_RE = re.compile(r"[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}")
+
+# Static templates for the per-mailbox lookup commands (%s = escaped identity,
+# then the Select-Object property list where applicable)
+_MAILBOX_DETAILS_TEMPLATE = """Get-EXOMailbox -Identity %s -PropertySets All |
+    Select-Object %s |
+    ConvertTo-Json -Depth 10"""
+
+_MAILBOX_STATISTICS_TEMPLATE = """Get-EXOMailboxStatistics -Identity %s |
+    Select-Object %s |
+    ConvertTo-Json -Depth 10"""
+
+_MAILBOX_EXISTS_TEMPLATE = """Get-EXOMailbox -Identity %s -ErrorAction SilentlyContinue |
+    Select-Object ExchangeGuid, UserPrincipalName |
+    ConvertTo-Json"""
+
 
 class CommandBuilder:
     """Build PowerShell commands for Exchange Online operations.
@@ -44,6 +64,10 @@ class CommandBuilder:
         "LastLogoffTime",
     ]
 
+    # Pre-formatted Select-Object lists for the default property sets
+    _DEFAULT_MAILBOX_PROPERTIES_STR = ", ".join(DEFAULT_MAILBOX_PROPERTIES)
+    _STATISTICS_PROPERTIES_STR = ", ".join(STATISTICS_PROPERTIES)
+
     def __init__(self) -> None:
         """Initialize command builder."""
         pass
@@ -146,14 +170,10 @@ class CommandBuilder:
         Returns:
             PowerShell command string
         """
-        escaped_id = self._escape_identity(identity)
-        props = self._format_properties(self.DEFAULT_MAILBOX_PROPERTIES)
-
-        cmd = f"""Get-EXOMailbox -Identity {escaped_id} -PropertySets All |
-    Select-Object {props} |
-    ConvertTo-Json -Depth 10"""
-
-        return cmd.strip()
+        return _MAILBOX_DETAILS_TEMPLATE % (
+            self._escape_identity(identity),
+            self._DEFAULT_MAILBOX_PROPERTIES_STR,
+        )
 
     def build_get_mailbox_statistics(self, identity: str) -> str:
         """Build command to get mailbox statistics.
@@ -164,14 +184,10 @@ class CommandBuilder:
         Returns:
             PowerShell command string
         """
-        escaped_id = self._escape_identity(identity)
-        props = self._format_properties(self.STATISTICS_PROPERTIES)
-
-        cmd = f"""Get-EXOMailboxStatistics -Identity {escaped_id} |
-    Select-Object {props} |
-    ConvertTo-Json -Depth 10"""
-
-        return cmd.strip()
+        return _MAILBOX_STATISTICS_TEMPLATE % (
+            self._escape_identity(identity),
+            self._STATISTICS_PROPERTIES_STR,
+        )
 
     def build_get_mailbox_holds(self, identity: str) -> str:
         """Build command to get mailbox hold information.
@@ -288,22 +304,26 @@ $result | ConvertTo-Json -Depth 10"""
         Returns:
             PowerShell command string
         """
-        escaped_id = self._escape_identity(identity)
-        cmd = f"""Get-EXOMailbox -Identity {escaped_id} -ErrorAction SilentlyContinue |
-    Select-Object ExchangeGuid, UserPrincipalName |
-    ConvertTo-Json"""
-        return cmd.strip()
+        return _MAILBOX_EXISTS_TEMPLATE % (self._escape_identity(identity),)
 
     def build_check_smtp_exists(self, smtp_address: str) -> str:
         """Build command to check if SMTP address is in use.
 
+        The address is embedded inside a quoted -Filter expression, so it is
+        validated against a strict SMTP shape rather than escaped.
+
         Args:
             smtp_address: SMTP address to check
 
         Returns:
             PowerShell command string
+
+        Raises:
+            ValueError: If smtp_address is not a valid SMTP address
         """
-        escaped_smtp = self._escape_parameter(smtp_address)
+        if not _SMTP_RE.fullmatch(smtp_address):
+            raise ValueError(f"Invalid SMTP address: {smtp_address!r}")
+
         cmd = f"""Get-EXORecipient -Filter "EmailAddresses -eq 'smtp:{smtp_address}'" -ErrorAction SilentlyContinue |
     Select-Object RecipientType, PrimarySmtpAddress |
     ConvertTo-Json"""
@@ -333,26 +353,22 @@ $result | ConvertTo-Json -Depth 10"""
         Returns:
             PowerShell command string
         """
-        escaped_guid = self._escape_identity(inactive_mailbox_guid)
         escaped_name = self._escape_parameter(display_name)
-        escaped_upn = self._escape_parameter(upn)
-        escaped_pwd = self._escape_parameter(password)
 
         cmd_parts = [
-            f"New-Mailbox -InactiveMailbox {escaped_guid}",
+            f"New-Mailbox -InactiveMailbox {self._escape_identity(inactive_mailbox_guid)}",
             f"-Name {escaped_name}",
             f"-DisplayName {escaped_name}",
-            f"-MicrosoftOnlineServicesID {escaped_upn}",
-            f"-Password (ConvertTo-SecureString -String {escaped_pwd} -AsPlainText -Force)",
+            f"-MicrosoftOnlineServicesID {self._escape_parameter(upn)}",
+            f"-Password (ConvertTo-SecureString -String {self._escape_parameter(password)}"
+            " -AsPlainText -Force)",
         ]
 
         if first_name:
-            escaped_first = self._escape_parameter(first_name)
-            cmd_parts.append(f"-FirstName {escaped_first}")
+            cmd_parts.append(f"-FirstName {self._escape_parameter(first_name)}")
 
         if last_name:
-            escaped_last = self._escape_parameter(last_name)
-            cmd_parts.append(f"-LastName {escaped_last}")
+            cmd_parts.append(f"-LastName {self._escape_parameter(last_name)}")
 
         if reset_password:
             cmd_parts.append("-ResetPasswordOnNextLogon $true")
@@ -436,37 +452,32 @@ $result | ConvertTo-Json -Depth 10"""
             PowerShell command string
         """
         # Validate cmdlet name (basic safety check)
-        if not re.match(r'^[A-Za-z]+-[A-Za-z]+$', cmdlet):
+        if not _CMDLET_RE.fullmatch(cmdlet):
             raise ValueError(f"Invalid cmdlet name: {cmdlet}")
 
-        parts = [cmdlet]
+        # Collect all fragments and join once at the end
+        out = [cmdlet]
 
         # Add parameters
         if parameters:
             for key, value in parameters.items():
                 # Validate parameter name
-                if not re.match(r'^[A-Za-z][A-Za-z0-9]*$', key):
+                if not _PARAM_RE.fullmatch(key):
                     continue
 
                 if isinstance(value, bool):
-                    if value:
-                        parts.append(f"-{key}")
-                    else:
-                        parts.append(f"-{key}:$false")
+                    out.append(f" -{key}" if value else f" -{key}:$false")
                 elif isinstance(value, (int, float)):
-                    parts.append(f"-{key} {value}")
+                    out.append(f" -{key} {value}")
                 elif isinstance(value, str):
-                    parts.append(f"-{key} {self._escape_parameter(value)}")
-
-        cmd = " ".join(parts)
+                    out.append(f" -{key} {self._escape_parameter(value)}")
 
         # Add Select-Object
         if select_properties:
-            props = self._format_properties(select_properties)
-            cmd += f" | Select-Object {props}"
+            out.append(f" | Select-Object {self._format_properties(select_properties)}")
 
         # Add JSON conversion
         if json_output:
-            cmd += " | ConvertTo-Json -Depth 10"
+            out.append(" | ConvertTo-Json -Depth 10")
 
-        return cmd
+        return "".join(out)
@@ -1,12 +1,20 @@
 """Configuration management system with YAML loading and environment variable overrides."""
 
 import os
-from dataclasses import dataclass, field
+from collections.abc import Callable
+from dataclasses import MISSING, dataclass, field
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# Prefer the libyaml-backed loader when PyYAML was built against libyaml;
+# fall back to the pure-Python loader otherwise.
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 
 class ConfigurationError(Exception):
     """Raised when configuration is invalid or cannot be loaded."""
@@ -14,7 +22,7 @@ class ConfigurationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ConnectionConfig:
     """Exchange Online connection settings."""
 
@@ -26,7 +34,7 @@ class ConnectionConfig:
     max_retries: int = 3
 
 
-@dataclass
+@dataclass(slots=True)
 class CostAnalysisConfig:
     """License cost analysis settings."""
 
@@ -44,7 +52,7 @@ class CostAnalysisConfig:
     currency_symbol: str = "$"
 
 
-@dataclass
+@dataclass(slots=True)
 class UIConfig:
     """User interface settings."""
 
@@ -55,7 +63,7 @@ class UIConfig:
     confirm_destructive: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class CacheConfig:
     """Local cache settings."""
 
@@ -65,7 +73,7 @@ class CacheConfig:
     db_path: str = "data/imm_cache.db"
 
 
-@dataclass
+@dataclass(slots=True)
 class AuditConfig:
     """Audit logging settings."""
 
@@ -76,7 +84,7 @@ class AuditConfig:
     json_format: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class BulkOperationsConfig:
     """Bulk operations settings."""
 
@@ -86,7 +94,7 @@ class BulkOperationsConfig:
     stop_on_error: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ExportConfig:
     """Export settings."""
 
@@ -97,7 +105,7 @@ class ExportConfig:
     timestamp_filenames: bool = True
 
 
-@dataclass
+@dataclass(slots=True)
 class Config:
     """Main configuration container."""
 
@@ -110,60 +118,97 @@ class Config:
     export: ExportConfig = field(default_factory=ExportConfig)
 
 
-def _get_env_override(section: str, key: str) -> str | None:
-    """Get environment variable override for a config key.
+# Section name -> dataclass for each top-level configuration section
+_SECTION_DATACLASSES: dict[str, type] = {
+    "connection": ConnectionConfig,
+    "cost_analysis": CostAnalysisConfig,
+    "ui": UIConfig,
+    "cache": CacheConfig,
+    "audit": AuditConfig,
+    "bulk_operations": BulkOperationsConfig,
+    "export": ExportConfig,
+}
+
+# Environment variable override name for every (section, key) pair.
+# Format: IMM_<SECTION>_<KEY> (e.g., IMM_CONNECTION_TENANT_ID)
+_ENV_KEY_MAP: dict[tuple[str, str], str] = {
+    (section, key): f"IMM_{section.upper()}_{key.upper()}"
+    for section, dc_class in _SECTION_DATACLASSES.items()
+    for key in dc_class.__dataclass_fields__
+}
+
+
+def _coerce_bool(value: str) -> bool:
+    """Interpret an environment string as a boolean."""
+    return value.lower() in ("true", "1", "yes")
+
+
+def _coerce_int(value: str) -> int | None:
+    """Interpret an environment string as an int (None if invalid)."""
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+def _coerce_float(value: str) -> float | None:
+    """Interpret an environment string as a float (None if invalid)."""
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+def _coerce_str(value: str) -> str:
+    """Use an environment string as-is."""
+    return value
+
+
+# Coercers keyed by the exact type of the value being overridden.
+# Keying on type() rather than isinstance() keeps bool from matching int.
+_ENV_COERCERS: dict[type, Callable[[str], Any]] = {
+    bool: _coerce_bool,
+    int: _coerce_int,
+    float: _coerce_float,
+    str: _coerce_str,
+}
 
-    Format: IMM_<SECTION>_<KEY> (e.g., IMM_CONNECTION_TENANT_ID)
+
+def _build_section(section: str, file_values: dict[str, Any]) -> Any:
+    """Build a section dataclass from file values and environment overrides.
+
+    Args:
+        section: Section name (e.g., "connection")
+        file_values: Settings for this section from the YAML file (may be empty)
+
+    Returns:
+        Dataclass instance for the section
     """
-    env_key = f"IMM_{section.upper()}_{key.upper()}"
-    return os.environ.get(env_key)
-
-
-def _apply_env_overrides(config_dict: dict[str, Any]) -> dict[str, Any]:
-    """Apply environment variable overrides to configuration dictionary."""
-    for section, values in config_dict.items():
-        if isinstance(values, dict):
-            for key, value in values.items():
-                env_value = _get_env_override(section, key)
-                if env_value is not None:
-                    # Convert to appropriate type based on original value
-                    if isinstance(value, bool):
-                        values[key] = env_value.lower() in ("true", "1", "yes")
-                    elif isinstance(value, int):
-                        try:
-                            values[key] = int(env_value)
-                        except ValueError:
-                            pass
-                    elif isinstance(value, float):
-                        try:
-                            values[key] = float(env_value)
-                        except ValueError:
-                            pass
-                    else:
-                        values[key] = env_value
-    return config_dict
-
-
-def _dict_to_dataclass(data: dict[str, Any], section: str) -> Any:
-    """Convert dictionary to appropriate dataclass based on section name."""
-    dataclass_map = {
-        "connection": ConnectionConfig,
-        "cost_analysis": CostAnalysisConfig,
-        "ui": UIConfig,
-        "cache": CacheConfig,
-        "audit": AuditConfig,
-        "bulk_operations": BulkOperationsConfig,
-        "export": ExportConfig,
-    }
-
-    if section not in dataclass_map:
-        return data
-
-    dc_class = dataclass_map[section]
+    dc_class = _SECTION_DATACLASSES[section]
+    dc_fields = dc_class.__dataclass_fields__
+
     # Filter out any keys not in the dataclass
-    valid_keys = {f.name for f in dc_class.__dataclass_fields__.values()}
-    filtered_data = {k: v for k, v in data.items() if k in valid_keys}
-    return dc_class(**filtered_data)
+    values = {k: v for k, v in file_values.items() if k in dc_fields}
+
+    # Apply environment variable overrides, converting to the type of the
+    # file value or the field default
+    for key, dc_field in dc_fields.items():
+        env_value = os.environ.get(_ENV_KEY_MAP[(section, key)])
+        if env_value is None:
+            continue
+
+        current = values.get(key, dc_field.default)
+        if current is MISSING:
+            # Factory-built defaults (e.g., license_costs) can't be set from a string
+            continue
+
+        coercer = _ENV_COERCERS.get(type(current), _coerce_str)
+        new_value = coercer(env_value)
+        # Invalid numbers leave the original value untouched
+        if new_value is not None:
+            values[key] = new_value
+
+    return dc_class(**values)
 
 
 def load_config(path: Path | str | None = None) -> Config:
@@ -183,55 +228,90 @@ def load_config(path: Path | str | None = None) -> Config:
     elif isinstance(path, str):
         path = Path(path)
 
-    # Start with default configuration
-    config_dict: dict[str, Any] = {
-        "connection": {},
-        "cost_analysis": {},
-        "ui": {},
-        "cache": {},
-        "audit": {},
-        "bulk_operations": {},
-        "export": {},
-    }
+    file_config: dict[str, Any] = {}
 
     # Load from file if it exists
     if path.exists():
         try:
             with open(path, "r", encoding="utf-8") as f:
-                file_config = yaml.safe_load(f) or {}
-                # Merge file config with defaults
-                for section in config_dict:
-                    if section in file_config and isinstance(file_config[section], dict):
-                        config_dict[section].update(file_config[section])
+                loaded = yaml.load(f, Loader=_YamlLoader)
+            if isinstance(loaded, dict):
+                file_config = loaded
         except yaml.YAMLError as e:
             raise ConfigurationError(f"Invalid YAML in configuration file: {e}") from e
         except OSError as e:
             raise ConfigurationError(f"Cannot read configuration file: {e}") from e
 
-    # Apply environment variable overrides
-    config_dict = _apply_env_overrides(config_dict)
-
-    # Convert to dataclasses
+    # Build each section directly from file values and environment overrides
     try:
-        config = Config(
-            connection=_dict_to_dataclass(config_dict.get("connection", {}), "connection"),
-            cost_analysis=_dict_to_dataclass(
-                config_dict.get("cost_analysis", {}), "cost_analysis"
-            ),
-            ui=_dict_to_dataclass(config_dict.get("ui", {}), "ui"),
-            cache=_dict_to_dataclass(config_dict.get("cache", {}), "cache"),
-            audit=_dict_to_dataclass(config_dict.get("audit", {}), "audit"),
-            bulk_operations=_dict_to_dataclass(
-                config_dict.get("bulk_operations", {}), "bulk_operations"
-            ),
-            export=_dict_to_dataclass(config_dict.get("export", {}), "export"),
-        )
+        sections = {}
+        for section in _SECTION_DATACLASSES:
+            file_values = file_config.get(section)
+            if not isinstance(file_values, dict):
+                file_values = {}
+            sections[section] = _build_section(section, file_values)
+        config = Config(**sections)
     except TypeError as e:
         raise ConfigurationError(f"Invalid configuration structure: {e}") from e
 
     return config
 
 
+# Accepted values for enumerated settings
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+_VALID_EXPORT_FORMATS = frozenset({"xlsx", "csv", "json", "pdf"})
+
+
+# Validation rules as (setting path, predicate that must hold, message on failure)
+_CONFIG_CONSTRAINTS: list[tuple[str, Callable[[Config], bool], str]] = [
+    # Connection settings
+    (
+        "connection.default_result_size",
+        lambda c: c.connection.default_result_size >= 1,
+        "must be positive",
+    ),
+    (
+        "connection.connection_timeout_minutes",
+        lambda c: c.connection.connection_timeout_minutes >= 1,
+        "must be positive",
+    ),
+    ("connection.max_retries", lambda c: c.connection.max_retries >= 0, "cannot be negative"),
+    # UI settings
+    ("ui.rows_per_page", lambda c: c.ui.rows_per_page >= 1, "must be positive"),
+    (
+        "ui.refresh_interval_minutes",
+        lambda c: c.ui.refresh_interval_minutes >= 0,
+        "cannot be negative",
+    ),
+    # Cache settings
+    ("cache.cache_duration_hours", lambda c: c.cache.cache_duration_hours >= 1, "must be positive"),
+    # Audit settings
+    (
+        "audit.log_level",
+        lambda c: c.audit.log_level.upper() in _VALID_LOG_LEVELS,
+        f"must be one of {', '.join(sorted(_VALID_LOG_LEVELS))}",
+    ),
+    ("audit.retention_days", lambda c: c.audit.retention_days >= 1, "must be positive"),
+    # Bulk operations settings
+    (
+        "bulk_operations.max_batch_size",
+        lambda c: c.bulk_operations.max_batch_size >= 1,
+        "must be positive",
+    ),
+    (
+        "bulk_operations.delay_between_operations_seconds",
+        lambda c: c.bulk_operations.delay_between_operations_seconds >= 0,
+        "cannot be negative",
+    ),
+    # Export settings
+    (
+        "export.default_format",
+        lambda c: c.export.default_format.lower() in _VALID_EXPORT_FORMATS,
+        f"must be one of {', '.join(sorted(_VALID_EXPORT_FORMATS))}",
+    ),
+]
+
+
 def validate_config(config: Config) -> list[str]:
     """Validate configuration and return list of issues.
 
@@ -241,42 +321,8 @@ def validate_config(config: Config) -> list[str]:
     Returns:
         List of validation error messages (empty if valid)
     """
-    issues: list[str] = []
-
-    # Validate connection settings
-    if config.connection.default_result_size < 1:
-        issues.append("connection.default_result_size must be positive")
-    if config.connection.connection_timeout_minutes < 1:
-        issues.append("connection.connection_timeout_minutes must be positive")
-    if config.connection.max_retries < 0:
-        issues.append("connection.max_retries cannot be negative")
-
-    # Validate UI settings
-    if config.ui.rows_per_page < 1:
-        issues.append("ui.rows_per_page must be positive")
-    if config.ui.refresh_interval_minutes < 0:
-        issues.append("ui.refresh_interval_minutes cannot be negative")
-
-    # Validate cache settings
-    if config.cache.cache_duration_hours < 1:
-        issues.append("cache.cache_duration_hours must be positive")
-
-    # Validate audit settings
-    valid_log_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-    if config.audit.log_level.upper() not in valid_log_levels:
-        issues.append(f"audit.log_level must be one of {valid_log_levels}")
-    if config.audit.retention_days < 1:
-        issues.append("audit.retention_days must be positive")
-
-    # Validate bulk operations settings
-    if config.bulk_operations.max_batch_size < 1:
-        issues.append("bulk_operations.max_batch_size must be positive")
-    if config.bulk_operations.delay_between_operations_seconds < 0:
-        issues.append("bulk_operations.delay_between_operations_seconds cannot be negative")
-
-    # Validate export settings
-    valid_formats = {"xlsx", "csv", "json", "pdf"}
-    if config.export.default_format.lower() not in valid_formats:
-        issues.append(f"export.default_format must be one of {valid_formats}")
-
-    return issues
+    return [
+        f"{path} {message}"
+        for path, predicate, message in _CONFIG_CONSTRAINTS
+        if not predicate(config)
+    ]
@@ -5,23 +5,70 @@ Provides consistent error handling, logging, and user feedback across the applic
 """
 
 import logging
-import traceback
+import os
+import time
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable
-
-from src.utils.exceptions import (
-    AppException,
-    AuthenticationError,
-    BulkOperationError,
-    ConfigurationError,
-    ConnectionError,
-    ErrorCode,
-    PowerShellError,
-    RecoveryError,
-    RestoreError,
-    ValidationError,
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+from src.utils.exceptions import ERROR_MESSAGES, AppException, ErrorCode
+from src.utils.logging import ORJSON_OPTIONS, dumps_json, json_default
+
+# Attach full tracebacks to ERROR-level log records only when explicitly requested;
+# formatting a traceback dominates the cost of handling an error in bulk flows.
+_CAPTURE_TRACEBACKS = os.environ.get("IMM_DEBUG_TRACEBACKS", "").lower() in ("true", "1", "yes")
+
+
+# Error codes for standard Python exceptions, keyed by exception class
+_EXCEPTION_CODE_MAP: dict[type, ErrorCode] = {
+    TimeoutError: ErrorCode.CONNECTION_TIMEOUT,
+    ConnectionError: ErrorCode.CONNECTION_FAILED,
+    FileNotFoundError: ErrorCode.CONFIG_NOT_FOUND,
+    PermissionError: ErrorCode.CONFIG_PERMISSION_DENIED,
+    ValueError: ErrorCode.VALIDATION_FAILED,
+    KeyError: ErrorCode.CONFIG_MISSING_REQUIRED,
+    OSError: ErrorCode.INTERNAL_ERROR,
+}
+
+
+# Suggestions attached to every result for a non-application exception
+# (shared, like the RECOVERY_SUGGESTIONS attached to AppException results)
+_UNKNOWN_ERROR_SUGGESTIONS = ("Check the logs for more details", "Try the operation again")
+
+# Error code classification used for severity and retry decisions
+_CRITICAL_CODES = frozenset(
+    {
+        ErrorCode.INTERNAL_ERROR,
+        ErrorCode.POWERSHELL_NOT_FOUND,
+        ErrorCode.SERVICE_UNAVAILABLE,
+    }
+)
+
+_WARNING_CODES = frozenset(
+    {
+        ErrorCode.AUTH_EXPIRED,
+        ErrorCode.CONNECTION_LOST,
+        ErrorCode.RATE_LIMITED,
+        ErrorCode.BULK_PARTIAL_FAILURE,
+    }
+)
+
+_RETRYABLE_CODES = frozenset(
+    {
+        ErrorCode.CONNECTION_FAILED,
+        ErrorCode.CONNECTION_TIMEOUT,
+        ErrorCode.CONNECTION_LOST,
+        ErrorCode.AUTH_EXPIRED,
+        ErrorCode.RATE_LIMITED,
+        ErrorCode.SERVICE_UNAVAILABLE,
+    }
 )
 
 
@@ -34,7 +81,35 @@ class ErrorSeverity(Enum):
     CRITICAL = "critical"
 
 
-@dataclass
+def _classify_code(code: ErrorCode) -> tuple[ErrorSeverity, bool]:
+    """Get the (severity, can_retry) classification shared by every error with a code."""
+    if code in _CRITICAL_CODES:
+        severity = ErrorSeverity.CRITICAL
+    elif code in _WARNING_CODES:
+        severity = ErrorSeverity.WARNING
+    else:
+        severity = ErrorSeverity.ERROR
+
+    return severity, code in _RETRYABLE_CODES
+
+
+# (severity, can_retry) for every error code, precomputed so handling an error
+# is a single dict lookup
+_CODE_CLASSIFICATION: dict[ErrorCode, tuple[ErrorSeverity, bool]] = {
+    code: _classify_code(code) for code in ErrorCode
+}
+
+
+# Logging level used for each error severity
+_SEVERITY_LOG_LEVELS: dict[ErrorSeverity, int] = {
+    ErrorSeverity.INFO: logging.INFO,
+    ErrorSeverity.WARNING: logging.WARNING,
+    ErrorSeverity.ERROR: logging.ERROR,
+    ErrorSeverity.CRITICAL: logging.CRITICAL,
+}
+
+
+@dataclass(slots=True)
 class ErrorResult:
     """Result of error handling with user-friendly information."""
 
@@ -42,10 +117,26 @@ class ErrorResult:
     message: str
     code: ErrorCode | None = None
     severity: ErrorSeverity = ErrorSeverity.ERROR
-    suggestions: list[str] = field(default_factory=list)
+    # Usually the shared, immutable suggestions of the error code
+    suggestions: Sequence[str] = ()
     details: dict[str, Any] = field(default_factory=dict)
-    timestamp: datetime = field(default_factory=datetime.now)
     can_retry: bool = False
+    # Raw clock reading; converted to a datetime only when timestamp is read
+    created_ns: int = field(default_factory=time.time_ns, repr=False)
+    # ISO-8601 form of timestamp, filled on first serialization
+    _iso_cache: str | None = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def timestamp(self) -> datetime:
+        """Get the local time at which the error result was created."""
+        return datetime.fromtimestamp(self.created_ns / 1_000_000_000)
+
+    @property
+    def timestamp_iso(self) -> str:
+        """Get the creation time as an ISO-8601 string (formatted once)."""
+        if self._iso_cache is None:
+            self._iso_cache = self.timestamp.isoformat()
+        return self._iso_cache
 
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for serialization."""
@@ -54,12 +145,48 @@ class ErrorResult:
             "message": self.message,
             "code": self.code.value if self.code else None,
             "severity": self.severity.value,
-            "suggestions": self.suggestions,
+            "suggestions": list(self.suggestions),
             "details": self.details,
-            "timestamp": self.timestamp.isoformat(),
+            "timestamp": self.timestamp_iso,
             "can_retry": self.can_retry,
         }
 
+    def to_json(self) -> str:
+        """Serialize to a compact JSON string with the same fields as to_dict().
+
+        Uses orjson when installed, which encodes the enums natively without
+        building the intermediate values. Both encoders share the options of
+        the JSON log formatter, so the output does not depend on orjson.
+        """
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    {
+                        "success": self.success,
+                        "message": self.message,
+                        "code": self.code,
+                        "severity": self.severity,
+                        "suggestions": self.suggestions,
+                        "details": self.details,
+                        "timestamp": self.timestamp_iso,
+                        "can_retry": self.can_retry,
+                    },
+                    default=json_default,
+                    option=ORJSON_OPTIONS,
+                ).decode("utf-8")
+            except TypeError:
+                # e.g. integers beyond 64 bits; let the stdlib encoder handle it
+                pass
+
+        return dumps_json(self.to_dict())
+
+
+@dataclass(slots=True)
+class BatchErrorResult(ErrorResult):
+    """Aggregate result passed to callbacks when a batch of errors is handled."""
+
+    results: list[ErrorResult] = field(default_factory=list)
+
 
 class ErrorHandler:
     """
@@ -70,19 +197,49 @@ class ErrorHandler:
 
     def __init__(self, logger: logging.Logger | None = None) -> None:
         self._logger = logger or logging.getLogger(__name__)
-        self._error_callbacks: list[Callable[[ErrorResult], None]] = []
+        # Immutable snapshots, rebuilt on (un)registration, so dispatch never copies.
+        # Trusted callbacks are called directly; others are guarded by try/except.
+        self._error_callbacks: tuple[Callable[[ErrorResult], None], ...] = ()
+        self._trusted_callbacks: tuple[Callable[[ErrorResult], None], ...] = ()
+
+    def register_callback(
+        self, callback: Callable[[ErrorResult], None], trusted: bool = False
+    ) -> None:
+        """Register a callback to be notified of errors.
 
-    def register_callback(self, callback: Callable[[ErrorResult], None]) -> None:
-        """Register a callback to be notified of errors."""
-        self._error_callbacks.append(callback)
+        Args:
+            callback: Callable receiving each ErrorResult
+            trusted: Call without exception guarding. Only use for internal
+                callbacks that cannot raise; an exception from a trusted
+                callback propagates out of handle().
+        """
+        if not callable(callback):
+            raise TypeError(f"Error callback must be callable, got {type(callback).__name__}")
+
+        if trusted:
+            self._trusted_callbacks = (*self._trusted_callbacks, callback)
+        else:
+            self._error_callbacks = (*self._error_callbacks, callback)
 
     def unregister_callback(self, callback: Callable[[ErrorResult], None]) -> None:
         """Unregister an error callback."""
         if callback in self._error_callbacks:
-            self._error_callbacks.remove(callback)
+            callbacks = list(self._error_callbacks)
+            callbacks.remove(callback)
+            self._error_callbacks = tuple(callbacks)
+        elif callback in self._trusted_callbacks:
+            callbacks = list(self._trusted_callbacks)
+            callbacks.remove(callback)
+            self._trusted_callbacks = tuple(callbacks)
 
     def _notify_callbacks(self, result: ErrorResult) -> None:
         """Notify all registered callbacks of an error."""
+        for callback in self._trusted_callbacks:
+            callback(result)
+
+        if not self._error_callbacks:
+            return
+
         for callback in self._error_callbacks:
             try:
                 callback(result)
@@ -104,6 +261,65 @@ class ErrorHandler:
         self._notify_callbacks(result)
         return result
 
+    def handle_batch(self, exceptions: list[Exception]) -> list[ErrorResult]:
+        """
+        Handle a batch of exceptions (e.g., per-row bulk failures) together.
+
+        Builds one ErrorResult per exception, but emits a single aggregated log
+        record and notifies callbacks once with a BatchErrorResult.
+
+        Args:
+            exceptions: The exceptions to handle
+
+        Returns:
+            ErrorResult for each exception, in the same order
+        """
+        if not exceptions:
+            return []
+
+        create = self._create_error_result
+        results = [create(exception) for exception in exceptions]
+
+        # Summarize by error code, keeping the highest severity seen and the
+        # first exception with that severity
+        counts: dict[str, int] = {}
+        level = logging.INFO
+        severity = ErrorSeverity.INFO
+        worst_exception = exceptions[0]
+        for exception, result in zip(exceptions, results, strict=True):
+            code_name = result.code.name if result.code else "UNKNOWN"
+            counts[code_name] = counts.get(code_name, 0) + 1
+            result_level = _SEVERITY_LOG_LEVELS[result.severity]
+            if result_level > level:
+                level = result_level
+                severity = result.severity
+                worst_exception = exception
+
+        if self._logger.isEnabledFor(level):
+            summary = ", ".join(f"{name} x{count}" for name, count in counts.items())
+            # At most one traceback per batch, from the exception that set the level
+            exc_info = (
+                worst_exception
+                if level == logging.CRITICAL or (level == logging.ERROR and _CAPTURE_TRACEBACKS)
+                else None
+            )
+            self._logger.log(
+                level, "Bulk: %d failures: %s", len(results), summary, exc_info=exc_info
+            )
+
+        self._notify_callbacks(
+            BatchErrorResult(
+                success=False,
+                message=f"{len(results)} operations failed",
+                code=ErrorCode.BULK_OPERATION_FAILED,
+                severity=severity,
+                details={"failed": len(results), "codes": counts},
+                can_retry=any(result.can_retry for result in results),
+                results=results,
+            )
+        )
+        return results
+
     def _create_error_result(self, exception: Exception) -> ErrorResult:
         """Create an ErrorResult from an exception."""
         if isinstance(exception, AppException):
@@ -113,8 +329,7 @@ class ErrorHandler:
 
     def _handle_app_exception(self, exception: AppException) -> ErrorResult:
         """Handle application-specific exceptions."""
-        severity = self._determine_severity(exception)
-        can_retry = self._can_retry(exception)
+        severity, can_retry = _CODE_CLASSIFICATION[exception.code]
 
         return ErrorResult(
             success=False,
@@ -137,33 +352,25 @@ class ErrorHandler:
             message=message,
             code=code,
             severity=ErrorSeverity.ERROR,
-            suggestions=["Check the logs for more details", "Try the operation again"],
+            suggestions=_UNKNOWN_ERROR_SUGGESTIONS,
             details={"exception_type": type(exception).__name__},
             can_retry=True,
         )
 
     def _map_exception_to_code(self, exception: Exception) -> ErrorCode:
         """Map standard Python exceptions to error codes."""
-        exception_type = type(exception).__name__
-
-        mapping = {
-            "TimeoutError": ErrorCode.CONNECTION_TIMEOUT,
-            "ConnectionError": ErrorCode.CONNECTION_FAILED,
-            "FileNotFoundError": ErrorCode.CONFIG_NOT_FOUND,
-            "PermissionError": ErrorCode.CONFIG_PERMISSION_DENIED,
-            "ValueError": ErrorCode.VALIDATION_FAILED,
-            "KeyError": ErrorCode.CONFIG_MISSING_REQUIRED,
-            "OSError": ErrorCode.INTERNAL_ERROR,
-        }
+        # Walk the MRO so subclasses (e.g. ConnectionRefusedError) map via their base
+        for exc_type in type(exception).__mro__:
+            code = _EXCEPTION_CODE_MAP.get(exc_type)
+            if code is not None:
+                return code
 
-        return mapping.get(exception_type, ErrorCode.UNKNOWN_ERROR)
+        return ErrorCode.UNKNOWN_ERROR
 
     def _get_user_message_for_exception(
         self, exception: Exception, code: ErrorCode
     ) -> str:
         """Get a user-friendly message for a standard exception."""
-        from src.utils.exceptions import ERROR_MESSAGES
-
         # Use template message if available
         if code in ERROR_MESSAGES:
             return ERROR_MESSAGES[code]
@@ -171,53 +378,30 @@ class ErrorHandler:
         # Otherwise, create a generic message
         return f"An error occurred: {str(exception)}"
 
-    def _determine_severity(self, exception: AppException) -> ErrorSeverity:
-        """Determine the severity level of an exception."""
-        critical_codes = {
-            ErrorCode.INTERNAL_ERROR,
-            ErrorCode.POWERSHELL_NOT_FOUND,
-            ErrorCode.SERVICE_UNAVAILABLE,
-        }
-
-        warning_codes = {
-            ErrorCode.AUTH_EXPIRED,
-            ErrorCode.CONNECTION_LOST,
-            ErrorCode.RATE_LIMITED,
-            ErrorCode.BULK_PARTIAL_FAILURE,
-        }
-
-        if exception.code in critical_codes:
-            return ErrorSeverity.CRITICAL
-        elif exception.code in warning_codes:
-            return ErrorSeverity.WARNING
-        else:
-            return ErrorSeverity.ERROR
-
-    def _can_retry(self, exception: AppException) -> bool:
-        """Determine if the operation can be retried."""
-        retryable_codes = {
-            ErrorCode.CONNECTION_FAILED,
-            ErrorCode.CONNECTION_TIMEOUT,
-            ErrorCode.CONNECTION_LOST,
-            ErrorCode.AUTH_EXPIRED,
-            ErrorCode.RATE_LIMITED,
-            ErrorCode.SERVICE_UNAVAILABLE,
-        }
-
-        return exception.code in retryable_codes
-
     def _log_error(self, exception: Exception, result: ErrorResult) -> None:
         """Log the error with appropriate level."""
-        log_message = f"[{result.code.name if result.code else 'UNKNOWN'}] {result.message}"
-
-        if result.severity == ErrorSeverity.CRITICAL:
-            self._logger.critical(log_message, exc_info=exception)
-        elif result.severity == ErrorSeverity.ERROR:
-            self._logger.error(log_message, exc_info=exception)
-        elif result.severity == ErrorSeverity.WARNING:
-            self._logger.warning(log_message)
+        level = _SEVERITY_LOG_LEVELS[result.severity]
+
+        # Skip all message building when the level is filtered out
+        if not self._logger.isEnabledFor(level):
+            return
+
+        code_name = result.code.name if result.code else "UNKNOWN"
+
+        if level == logging.CRITICAL or (level == logging.ERROR and _CAPTURE_TRACEBACKS):
+            self._logger.log(level, "[%s] %s", code_name, result.message, exc_info=exception)
+        elif level == logging.ERROR:
+            # Keep the original exception text without formatting a traceback
+            self._logger.log(
+                level,
+                "[%s] %s (%s: %s)",
+                code_name,
+                result.message,
+                type(exception).__name__,
+                exception,
+            )
         else:
-            self._logger.info(log_message)
+            self._logger.log(level, "[%s] %s", code_name, result.message)
 
     def wrap(
         self, func: Callable, default_return: Any = None
@@ -227,14 +411,13 @@ class ErrorHandler:
 
         Returns a tuple of (result, error) where error is None on success.
         """
+        handle = self.handle
 
         def wrapper(*args: Any, **kwargs: Any) -> tuple[Any, ErrorResult | None]:
             try:
-                result = func(*args, **kwargs)
-                return result, None
+                return func(*args, **kwargs), None
             except Exception as e:
-                error_result = self.handle(e)
-                return default_return, error_result
+                return default_return, handle(e)
 
         return wrapper
 
@@ -253,28 +436,24 @@ class ErrorHandler:
             Tuple of (result, error) where error is None on success
         """
         try:
-            result = func(*args, **kwargs)
-            return result, None
+            return func(*args, **kwargs), None
         except Exception as e:
-            error_result = self.handle(e)
-            return None, error_result
+            return None, self.handle(e)
 
 
-# Global error handler instance
-_error_handler: ErrorHandler | None = None
+# Global error handler instance, created at import so lookups need no None check
+# and concurrent first calls cannot race to create two handlers
+_error_handler: ErrorHandler = ErrorHandler()
 
 
 def get_error_handler() -> ErrorHandler:
     """Get the global error handler instance."""
-    global _error_handler
-    if _error_handler is None:
-        _error_handler = ErrorHandler()
     return _error_handler
 
 
 def handle_error(exception: Exception) -> ErrorResult:
     """Convenience function to handle an error using the global handler."""
-    return get_error_handler().handle(exception)
+    return _error_handler.handle(exception)
 
 
 def format_error_for_display(result: ErrorResult) -> str:
@@ -283,25 +462,19 @@ def format_error_for_display(result: ErrorResult) -> str:
 
     Returns a multi-line string suitable for display.
     """
-    lines = [
-        f"Error: {result.message}",
-        "",
-    ]
+    parts = [f"Error: {result.message}\n"]
 
     if result.code:
-        lines.append(f"Error Code: {result.code.name} ({result.code.value})")
+        parts.append(f"\nError Code: {result.code.name} ({result.code.value})")
 
     if result.suggestions:
-        lines.append("")
-        lines.append("Suggestions:")
-        for suggestion in result.suggestions:
-            lines.append(f"  - {suggestion}")
+        parts.append("\n\nSuggestions:\n  - ")
+        parts.append("\n  - ".join(result.suggestions))
 
     if result.can_retry:
-        lines.append("")
-        lines.append("This operation can be retried.")
+        parts.append("\n\nThis operation can be retried.")
 
-    return "\n".join(lines)
+    return "".join(parts)
 
 
 def format_error_for_log(result: ErrorResult, include_traceback: bool = True) -> str:
@@ -310,16 +483,17 @@ def format_error_for_log(result: ErrorResult, include_traceback: bool = True) ->
 
     Returns a detailed string suitable for log files.
     """
-    lines = [
-        f"Timestamp: {result.timestamp.isoformat()}",
-        f"Severity: {result.severity.value.upper()}",
-        f"Code: {result.code.name if result.code else 'UNKNOWN'} ({result.code.value if result.code else 'N/A'})",
-        f"Message: {result.message}",
-    ]
+    code_name = result.code.name if result.code else "UNKNOWN"
+    code_value = result.code.value if result.code else "N/A"
+    text = (
+        f"Timestamp: {result.timestamp_iso}\n"
+        f"Severity: {result.severity.value.upper()}\n"
+        f"Code: {code_name} ({code_value})\n"
+        f"Message: {result.message}"
+    )
 
     if result.details:
-        lines.append("Details:")
-        for key, value in result.details.items():
-            lines.append(f"  {key}: {value}")
+        details = "\n".join(f"  {key}: {value}" for key, value in result.details.items())
+        text = f"{text}\nDetails:\n{details}"
 
-    return "\n".join(lines)
+    return text
@@ -131,64 +131,78 @@ ERROR_MESSAGES: dict[ErrorCode, str] = {
 }
 
 # Recovery suggestions for each error code
-RECOVERY_SUGGESTIONS: dict[ErrorCode, list[str]] = {
-    ErrorCode.CONNECTION_FAILED: [
+RECOVERY_SUGGESTIONS: dict[ErrorCode, tuple[str, ...]] = {
+    ErrorCode.CONNECTION_FAILED: (
         "Check your internet connection",
         "Verify the organization name in settings",
         "Try again in a few minutes",
         "Check Exchange Online service status",
-    ],
-    ErrorCode.AUTH_FAILED: [
+    ),
+    ErrorCode.AUTH_FAILED: (
         "Verify your Application ID is correct",
         "Check that admin consent was granted",
         "Ensure the certificate/secret hasn't expired",
         "Try re-authenticating",
-    ],
-    ErrorCode.AUTH_CERTIFICATE_ERROR: [
+    ),
+    ErrorCode.AUTH_CERTIFICATE_ERROR: (
         "Verify the certificate file path",
         "Check the certificate password",
         "Ensure the certificate hasn't expired",
         "Verify the public key is uploaded to Azure AD",
-    ],
-    ErrorCode.AUTH_INSUFFICIENT_PERMISSIONS: [
+    ),
+    ErrorCode.AUTH_INSUFFICIENT_PERMISSIONS: (
         "Add Exchange.ManageAsApp permission in Azure AD",
         "Grant admin consent for the permission",
         "Assign Exchange Administrator role to the app",
         "Wait a few minutes for permissions to propagate",
-    ],
-    ErrorCode.CONFIG_NOT_FOUND: [
+    ),
+    ErrorCode.CONFIG_NOT_FOUND: (
         "Run the onboarding wizard to create configuration",
         "Copy config.example.yaml to config.yaml",
         "Check the application directory for config files",
-    ],
-    ErrorCode.VALIDATION_UPN_EXISTS: [
+    ),
+    ErrorCode.VALIDATION_UPN_EXISTS: (
         "Choose a different User Principal Name",
         "Check for soft-deleted users with the same UPN",
         "Add a suffix to make the UPN unique (e.g., .recovered)",
-    ],
-    ErrorCode.VALIDATION_SMTP_CONFLICT: [
+    ),
+    ErrorCode.VALIDATION_SMTP_CONFLICT: (
         "Check existing mailboxes for the email address",
         "Check groups and distribution lists",
         "Remove the address from conflicting objects first",
-    ],
-    ErrorCode.POWERSHELL_NOT_FOUND: [
+    ),
+    ErrorCode.POWERSHELL_NOT_FOUND: (
         "Install PowerShell Core 7: https://github.com/PowerShell/PowerShell",
         "Add PowerShell to your system PATH",
         "Restart the application after installation",
-    ],
-    ErrorCode.POWERSHELL_MODULE_MISSING: [
+    ),
+    ErrorCode.POWERSHELL_MODULE_MISSING: (
         "Open PowerShell as administrator",
         "Run: Install-Module ExchangeOnlineManagement -Force",
         "Restart the application",
-    ],
-    ErrorCode.RATE_LIMITED: [
+    ),
+    ErrorCode.RATE_LIMITED: (
         "Wait 1-2 minutes before retrying",
         "Reduce the batch size for bulk operations",
         "Schedule large operations during off-peak hours",
-    ],
+    ),
 }
 
 
+def _build_code_table(mapping: dict[ErrorCode, Any]) -> list[Any]:
+    """Build a list indexed by ErrorCode.value from a code-keyed mapping."""
+    table: list[Any] = [None] * (max(code.value for code in ErrorCode) + 1)
+    for code, value in mapping.items():
+        table[code.value] = value
+    return table
+
+
+# Dense lookup tables indexed by ErrorCode.value, built once from the mappings
+# above (which should be treated as read-only)
+_MESSAGE_TABLE: list[str | None] = _build_code_table(ERROR_MESSAGES)
+_SUGGESTION_TABLE: list[tuple[str, ...] | None] = _build_code_table(RECOVERY_SUGGESTIONS)
+
+
 class AppException(Exception):
     """Base exception for all application errors."""
 
@@ -200,13 +214,48 @@ class AppException(Exception):
         cause: Exception | None = None,
     ) -> None:
         self.code = code
-        self.details = details or {}
+        self.details = details if details is not None else {}
         self.cause = cause
 
-        # Use provided message or default from templates
-        self.message = message or ERROR_MESSAGES.get(code, "An error occurred")
+        # Enum name/value go through descriptor lookups; read them once here
+        self._code_name = code.name
+        self._code_value = code.value
 
-        super().__init__(self.message)
+        # Only an explicit message is stored; template messages are looked up on
+        # read, and args, str(), repr() and pickling all go through that lookup
+        self._message_override = message
+
+        super().__init__()
+
+    @property  # type: ignore[override]
+    def args(self) -> tuple[Any, ...]:
+        """Get the exception arguments: the resolved message."""
+        return (self.message,)
+
+    @args.setter
+    def args(self, value: tuple[Any, ...]) -> None:
+        """Set the exception arguments; the first one becomes the message."""
+        self._message_override = str(value[0]) if value else None
+
+    def __str__(self) -> str:
+        return self.message
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.message!r})"
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # BaseException.__reduce__ reads the C-level args, which stay empty here
+        return type(self), (self._message_override,), self.__dict__
+
+    @property
+    def message(self) -> str:
+        """Get the error message (provided or default from templates)."""
+        return self._message_override or _MESSAGE_TABLE[self._code_value] or "An error occurred"
+
+    @message.setter
+    def message(self, value: str | None) -> None:
+        """Set the error message (None restores the template message)."""
+        self._message_override = value
 
     @property
     def user_message(self) -> str:
@@ -214,23 +263,23 @@ class AppException(Exception):
         return self.message
 
     @property
-    def suggestions(self) -> list[str]:
-        """Get recovery suggestions for this error."""
-        return RECOVERY_SUGGESTIONS.get(self.code, [])
+    def suggestions(self) -> tuple[str, ...]:
+        """Get recovery suggestions for this error (shared, immutable)."""
+        return _SUGGESTION_TABLE[self._code_value] or ()
 
     @property
     def error_code(self) -> int:
         """Get numeric error code."""
-        return self.code.value
+        return self._code_value
 
     def to_dict(self) -> dict[str, Any]:
         """Convert exception to dictionary for serialization."""
         return {
-            "code": self.code.value,
-            "code_name": self.code.name,
+            "code": self._code_value,
+            "code_name": self._code_name,
             "message": self.message,
             "details": self.details,
-            "suggestions": self.suggestions,
+            "suggestions": list(self.suggestions),
         }
 
 
@@ -280,7 +329,8 @@ class ValidationError(AppException):
         field: str | None = None,
         **kwargs: Any,
     ) -> None:
-        details = kwargs.pop("details", {})
+        # Copy so the caller's details dict is never modified
+        details = {**(kwargs.pop("details", None) or {})}
         if field:
             details["field"] = field
         super().__init__(message=message, code=code, details=details, **kwargs)
@@ -296,7 +346,7 @@ class RecoveryError(AppException):
         mailbox: str | None = None,
         **kwargs: Any,
     ) -> None:
-        details = kwargs.pop("details", {})
+        details = {**(kwargs.pop("details", None) or {})}
         if mailbox:
             details["mailbox"] = mailbox
         super().__init__(message=message, code=code, details=details, **kwargs)
@@ -313,7 +363,7 @@ class RestoreError(AppException):
         target_mailbox: str | None = None,
         **kwargs: Any,
     ) -> None:
-        details = kwargs.pop("details", {})
+        details = {**(kwargs.pop("details", None) or {})}
         if source_mailbox:
             details["source_mailbox"] = source_mailbox
         if target_mailbox:
@@ -332,9 +382,11 @@ class BulkOperationError(AppException):
         failed: int = 0,
         **kwargs: Any,
     ) -> None:
-        details = kwargs.pop("details", {})
-        details["succeeded"] = succeeded
-        details["failed"] = failed
+        details = {
+            **(kwargs.pop("details", None) or {}),
+            "succeeded": succeeded,
+            "failed": failed,
+        }
         super().__init__(message=message, code=code, details=details, **kwargs)
 
 
@@ -349,7 +401,7 @@ class PowerShellError(AppException):
         stderr: str | None = None,
         **kwargs: Any,
     ) -> None:
-        details = kwargs.pop("details", {})
+        details = {**(kwargs.pop("details", None) or {})}
         if command:
             details["command"] = command
         if stderr:
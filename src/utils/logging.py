@@ -1,45 +1,202 @@
 """Structured logging with Rich console output and JSON file logging."""
 
+import atexit
+import copy
 import json
 import logging
+import math
+import os
+import queue
 import sys
-from datetime import datetime, timezone
-from logging.handlers import RotatingFileHandler
+import time
+from enum import Enum
+from logging.handlers import MemoryHandler, QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
-from typing import Any
-
-from rich.console import Console
-from rich.logging import RichHandler
-from rich.theme import Theme
-
-# Custom theme matching brutalist dark branding
-BRUTALIST_THEME = Theme(
-    {
-        "logging.level.debug": "dim cyan",
-        "logging.level.info": "green",
-        "logging.level.warning": "yellow",
-        "logging.level.error": "red bold",
-        "logging.level.critical": "red bold reverse",
-        "log.time": "dim green",
-        "log.message": "green",
-        "log.path": "dim green",
-    }
+from typing import TYPE_CHECKING, Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Custom theme styles matching brutalist dark branding
+BRUTALIST_THEME_STYLES = {
+    "logging.level.debug": "dim cyan",
+    "logging.level.info": "green",
+    "logging.level.warning": "yellow",
+    "logging.level.error": "red bold",
+    "logging.level.critical": "red bold reverse",
+    "log.time": "dim green",
+    "log.message": "green",
+    "log.path": "dim green",
+}
+
+# Global console instance, created on first use by get_console()
+console: "Console | None" = None
+
+# orjson options for the app's JSON output. Detail dicts may carry non-string
+# keys, and datetimes and dataclasses go through json_default as they do with
+# the stdlib encoder, so both encoders produce the same JSON.
+ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+    if orjson is not None
+    else 0
 )
 
-# Global console instance
-console = Console(theme=BRUTALIST_THEME, force_terminal=True)
+# Compact stdlib separators, matching orjson's output
+_JSON_SEPARATORS = (",", ":")
+
+# Last formatted (epoch second, ISO-8601 prefix) pair; records logged within the
+# same second reuse the prefix and only format the microseconds
+_timestamp_cache: tuple[int, str] = (-1, "")
+
+# Number of JSON records buffered before a batched write to the JSON log file;
+# ERROR and above flush immediately
+_JSON_BUFFER_CAPACITY = 256
+
+# Timestamp format for plain-text log lines
+_TEXT_DATEFMT = "%Y-%m-%d %H:%M:%S"
+
+# Log level for each log_operation result; any other result logs as ERROR
+_RESULT_LOG_LEVELS = {"success": logging.INFO, "warning": logging.WARNING}
 
 # Track if logging has been set up
 _logging_initialized = False
 
+# Renders tracebacks for queued records, before they leave the logging thread
+_EXCEPTION_FORMATTER = logging.Formatter()
+
+# Background listener writing file log records, started by setup_logging
+_queue_listener: QueueListener | None = None
+
+
+def get_console() -> "Console":
+    """Get the shared Rich console, creating it on first use.
+
+    Rich is imported here rather than at module load, so importing this
+    module (e.g. in tests) does not pay for console setup. Terminal output
+    is detected once, here.
+
+    Returns:
+        Console using the brutalist theme
+    """
+    global console
+
+    if console is None:
+        from rich.console import Console
+        from rich.theme import Theme
+
+        # Style and highlight only for a terminal; piped or redirected output
+        # (CI, log capture) gets plain text. stdout is None under pythonw.
+        is_tty = bool(sys.stdout and sys.stdout.isatty())
+        console = Console(
+            theme=Theme(BRUTALIST_THEME_STYLES),
+            force_terminal=is_tty,
+            highlight=is_tty,
+            no_color=not is_tty,
+        )
+    return console
+
+
+def _format_timestamp(created: float) -> str:
+    """Format a record creation time as an ISO-8601 UTC timestamp."""
+    global _timestamp_cache
+
+    sec = int(created)
+    cached_sec, prefix = _timestamp_cache
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _timestamp_cache = (sec, prefix)
+
+    return f"{prefix}.{int((created - sec) * 1e6):06d}+00:00"
+
+
+def json_default(value: Any) -> Any:
+    """Encode a value JSON has no type for (the default hook of both encoders).
+
+    Enums become their value, as orjson encodes them natively; anything else
+    becomes its str().
+    """
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def _finite(value: Any) -> Any:
+    """Copy value with NaN and infinite floats replaced by None, as orjson writes them."""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite(item) for item in value]
+    return value
+
+
+def dumps_json(value: Any) -> str:
+    """Encode value with the stdlib encoder, matching orjson with ORJSON_OPTIONS."""
+    try:
+        return json.dumps(
+            value,
+            default=json_default,
+            separators=_JSON_SEPARATORS,
+            ensure_ascii=False,
+            allow_nan=False,
+        )
+    except ValueError:
+        # NaN or infinity somewhere in value
+        return json.dumps(
+            _finite(value), default=json_default, separators=_JSON_SEPARATORS, ensure_ascii=False
+        )
+
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for file logging - enables SIEM integration."""
 
     def format(self, record: logging.LogRecord) -> str:
-        """Format log record as JSON."""
+        """Format log record as JSON.
+
+        Uses orjson when installed, otherwise the standard library encoder.
+        """
+        log_data = self._build_log_data(record)
+
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    log_data, default=json_default, option=ORJSON_OPTIONS
+                ).decode("utf-8")
+            except TypeError:
+                # e.g. integers beyond 64 bits; let the stdlib encoder handle it
+                pass
+
+        return dumps_json(log_data)
+
+    def format_bytes(self, record: logging.LogRecord) -> bytes:
+        """Format log record as a UTF-8 encoded JSON line, newline included.
+
+        With orjson this skips the intermediate str entirely.
+        """
+        log_data = self._build_log_data(record)
+
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    log_data,
+                    default=json_default,
+                    option=ORJSON_OPTIONS | orjson.OPT_APPEND_NEWLINE,
+                )
+            except TypeError:
+                pass
+
+        return f"{dumps_json(log_data)}\n".encode()
+
+    def _build_log_data(self, record: logging.LogRecord) -> dict[str, Any]:
+        """Collect the fields serialized for a log record."""
         log_data: dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": _format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -48,15 +205,128 @@ class JSONFormatter(logging.Formatter):
             "line": record.lineno,
         }
 
-        # Add exception info if present
-        if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+        # Add exception info if present (queued records carry only the text)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            log_data["exception"] = record.exc_text
 
         # Add extra fields if present
         if hasattr(record, "extra_data"):
             log_data["extra"] = record.extra_data
 
-        return json.dumps(log_data, default=str)
+        return log_data
+
+
+class TextFormatter(logging.Formatter):
+    """Plain-text formatter for file logging.
+
+    Produces "asctime | level | name:line | message" lines, the same output as
+    the equivalent %-style format string, using an f-string and a local time
+    string cached per second.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(datefmt=_TEXT_DATEFMT)
+        self._asctime_cache: tuple[int, str] = (-1, "")
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as a plain-text line, plus any traceback."""
+        sec = int(record.created)
+        cached_sec, asctime = self._asctime_cache
+        if sec != cached_sec:
+            asctime = time.strftime(_TEXT_DATEFMT, self.converter(sec))
+            self._asctime_cache = (sec, asctime)
+
+        text = (
+            f"{asctime} | {record.levelname:<8} | "
+            f"{record.name}:{record.lineno} | {record.getMessage()}"
+        )
+
+        # Exception and stack text, as appended by logging.Formatter.format
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            if text[-1:] != "\n":
+                text += "\n"
+            text += record.exc_text
+        if record.stack_info:
+            if text[-1:] != "\n":
+                text += "\n"
+            text += self.formatStack(record.stack_info)
+        return text
+
+
+class JSONFileHandler(RotatingFileHandler):
+    """Rotating file handler writing JSON lines as bytes.
+
+    The file is opened in binary mode and records formatted by a JSONFormatter
+    are written as the encoder's bytes, avoiding a str round trip per record.
+    """
+
+    def _open(self) -> Any:
+        """Open the log file for binary append."""
+        return open(self.baseFilename, "ab")
+
+    def _should_rollover(self, size: int) -> bool:
+        """Check if writing size more bytes should roll the file over.
+
+        Mirrors RotatingFileHandler.shouldRollover for an already-encoded record,
+        including never rotating non-regular files such as /dev/null or a FIFO.
+        """
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0 or self.stream.tell() + size < self.maxBytes:
+            return False
+        return os.path.isfile(self.baseFilename)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Write a record, rolling the file over first if it would overflow."""
+        try:
+            formatter = self.formatter
+            if isinstance(formatter, JSONFormatter):
+                data = formatter.format_bytes(record)
+            else:
+                data = f"{self.format(record)}\n".encode()
+
+            if self._should_rollover(len(data)):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+
+            self.stream.write(data)
+            self.flush()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _LocalQueueHandler(QueueHandler):
+    """Queue handler for an in-process listener.
+
+    Like QueueHandler, records are snapshotted before they are queued: the
+    message is merged with its args and any traceback is rendered to exc_text,
+    so later changes to the arguments don't leak into the log and queued records
+    hold no frames. Unlike QueueHandler, the line itself is not pre-formatted,
+    so each file handler still applies its own formatter.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Return a copy of the record that is safe to format on another thread."""
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = _EXCEPTION_FORMATTER.formatException(record.exc_info)
+
+        record = copy.copy(record)
+        record.message = message
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        extra_data = getattr(record, "extra_data", None)
+        if isinstance(extra_data, dict):
+            record.extra_data = dict(extra_data)
+        return record
 
 
 class ContextLogger(logging.Logger):
@@ -112,11 +382,11 @@ def setup_logging(
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Path to plain text log file (optional)
-        json_file: Path to JSON format log file for SIEM (optional)
+        json_file: Path to JSON format log file for SIEM (optional, buffered)
         max_bytes: Maximum size per log file before rotation (default 10MB)
         backup_count: Number of backup files to keep (default 5)
     """
-    global _logging_initialized
+    global _logging_initialized, _queue_listener
 
     if _logging_initialized:
         return
@@ -131,20 +401,27 @@ def setup_logging(
     # Clear any existing handlers
     root_logger.handlers.clear()
 
+    from rich.logging import RichHandler
+
     # Rich console handler with beautiful formatting
+    rich_console = get_console()
     rich_handler = RichHandler(
-        console=console,
+        console=rich_console,
         show_time=True,
         show_level=True,
         show_path=True,
-        rich_tracebacks=True,
+        rich_tracebacks=rich_console.is_terminal,
         tracebacks_show_locals=True,
-        markup=True,
+        markup=rich_console.is_terminal,
     )
     rich_handler.setLevel(numeric_level)
     rich_handler.setFormatter(logging.Formatter("%(message)s"))
     root_logger.addHandler(rich_handler)
 
+    # File handlers run on a background listener thread so that writes and
+    # rotation never block the logging caller
+    file_handlers: list[logging.Handler] = []
+
     # Plain text file handler (optional)
     if log_file:
         log_path = Path(log_file) if isinstance(log_file, str) else log_file
@@ -157,28 +434,45 @@ def setup_logging(
             encoding="utf-8",
         )
         file_handler.setLevel(numeric_level)
-        file_handler.setFormatter(
-            logging.Formatter(
-                "%(asctime)s | %(levelname)-8s | %(name)s:%(lineno)d | %(message)s",
-                datefmt="%Y-%m-%d %H:%M:%S",
-            )
-        )
-        root_logger.addHandler(file_handler)
+        file_handler.setFormatter(TextFormatter())
+        file_handlers.append(file_handler)
 
     # JSON file handler for SIEM integration (optional)
     if json_file:
         json_path = Path(json_file) if isinstance(json_file, str) else json_file
         json_path.parent.mkdir(parents=True, exist_ok=True)
 
-        json_handler = RotatingFileHandler(
+        json_handler = JSONFileHandler(
             json_path,
             maxBytes=max_bytes,
             backupCount=backup_count,
-            encoding="utf-8",
         )
         json_handler.setLevel(numeric_level)
         json_handler.setFormatter(JSONFormatter())
-        root_logger.addHandler(json_handler)
+
+        # Batch JSON writes; records are flushed on ERROR, when the buffer
+        # fills, and at interpreter exit
+        buffered_json_handler = MemoryHandler(
+            capacity=_JSON_BUFFER_CAPACITY,
+            flushLevel=logging.ERROR,
+            target=json_handler,
+            flushOnClose=True,
+        )
+        buffered_json_handler.setLevel(numeric_level)
+        file_handlers.append(buffered_json_handler)
+        atexit.register(buffered_json_handler.flush)
+
+    if file_handlers:
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        queue_handler = _LocalQueueHandler(log_queue)
+        queue_handler.setLevel(numeric_level)
+        root_logger.addHandler(queue_handler)
+
+        _queue_listener = QueueListener(log_queue, *file_handlers, respect_handler_level=True)
+        _queue_listener.start()
+        # Registered after the JSON flush hook, so it runs first and drains
+        # the queue into the buffer before that buffer is flushed
+        atexit.register(_queue_listener.stop)
 
     # Reduce noise from third-party libraries
     logging.getLogger("urllib3").setLevel(logging.WARNING)
@@ -208,6 +502,9 @@ def log_exception(logger: logging.Logger, exc: Exception, context: str = "") ->
         exc: Exception to log
         context: Additional context about what was happening
     """
+    if not logger.isEnabledFor(logging.ERROR):
+        return
+
     if context:
         logger.exception(f"{context}: {exc}")
     else:
@@ -232,6 +529,10 @@ def log_operation(
         result: Operation result (success, failure, warning)
         error: Error message if operation failed (optional)
     """
+    level = _RESULT_LOG_LEVELS.get(result, logging.ERROR)
+    if not logger.isEnabledFor(level):
+        return
+
     msg_parts = [f"Operation: {operation}"]
     if identity:
         msg_parts.append(f"Identity: {identity}")
@@ -249,18 +550,11 @@ def log_operation(
         "error": error,
     }
 
-    if result == "success":
-        if hasattr(logger, "info_ctx"):
-            logger.info_ctx(msg, ctx=extra_data)  # type: ignore
-        else:
-            logger.info(msg, extra={"extra_data": extra_data})
-    elif result == "warning":
-        if hasattr(logger, "warning_ctx"):
-            logger.warning_ctx(msg, ctx=extra_data)  # type: ignore
-        else:
-            logger.warning(msg, extra={"extra_data": extra_data})
-    else:
-        if hasattr(logger, "error_ctx"):
-            logger.error_ctx(msg, ctx=extra_data)  # type: ignore
-        else:
-            logger.error(msg, extra={"extra_data": extra_data})
+    # Equivalent to the ContextLogger *_ctx methods, and also works for plain
+    # loggers; stacklevel attributes the record to the caller
+    logger.log(
+        level,
+        msg,
+        extra={"extra_data": extra_data},
+        stacklevel=2,
+    )
@@ -2,12 +2,102 @@
 
 import json
 import re
+import string
+from functools import lru_cache
 from typing import Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Characters after which a capital letter starts a new snake_case word
+_ASCII_LOWERCASE = frozenset(string.ascii_lowercase)
+_SNAKE_BOUNDARY_CHARS = frozenset(string.ascii_lowercase + string.digits)
+
+# PowerShell stream prefixes that never belong to JSON output
+_SKIPPED_LINE_PREFIXES = ("WARNING:", "VERBOSE:")
+
+# First characters of a JSON document PowerShell can return, and an empty or
+# whitespace-only line inside output (which _clean_output drops)
+_JSON_START_CHARS = ("{", "[")
+_BLANK_LINE_RE = re.compile(r"\n\s*\n")
+
+# A run of digits long enough for an integer outside the 64-bit range, which
+# orjson cannot decode exactly (it returns a lossy float or raises)
+_WIDE_INT_RE = re.compile(r"\d{19}")
+
+# InPlaceHolds prefixes: prefix -> (hold_type, hold_name)
+_HOLD_TYPES_BY_PREFIX: dict[str, tuple[str, str]] = {
+    "UniH": ("unified_hold", "Unified eDiscovery Hold"),
+    "mbx": ("mailbox_hold", "Mailbox Hold"),
+    "skp": ("skype_hold", "Skype for Business Hold"),
+    "cld": ("cloud_hold", "Cloud Hold"),
+    "grp": ("group_hold", "Group Hold"),
+}
+_RETENTION_POLICY_HOLD_TYPE = ("retention_policy", "Retention Policy")
+_UNKNOWN_HOLD_TYPE = ("unknown", None)
+
+# Exchange size strings, e.g. "1.5 GB (1,610,612,736 bytes)"
+_SIZE_BYTES_RE = re.compile(r"\(([0-9,]+)\s*bytes?\)", re.IGNORECASE)
+_SIZE_UNIT_RE = re.compile(r"([0-9.]+)\s*(B|KB|MB|GB|TB)", re.IGNORECASE)
+
+# XML error detail sometimes embedded in Exchange error output
+_XML_MESSAGE_RE = re.compile(r"<Message>(.*?)</Message>", re.DOTALL)
+
+# Common Exchange Online error patterns: (pattern, error_type, friendly_message)
+_ERROR_PATTERNS: list[tuple[re.Pattern[str], str, str]] = [
+    (re.compile(pattern, re.IGNORECASE), error_type, friendly_message)
+    for pattern, error_type, friendly_message in [
+        # Throttling errors
+        (
+            r"throttl",
+            "throttling",
+            "Request throttled. Please wait before retrying.",
+        ),
+        # Session errors
+        (
+            r"session.*(expired|closed|invalid)",
+            "session_expired",
+            "Exchange Online session has expired. Reconnection required.",
+        ),
+        # Authentication errors
+        (
+            r"(unauthorized|authentication|access.denied)",
+            "authentication",
+            "Authentication failed or access denied.",
+        ),
+        # Not found errors
+        (
+            r"(couldn't be found|does not exist|not found)",
+            "not_found",
+            "The requested mailbox or resource was not found.",
+        ),
+        # Invalid operation
+        (
+            r"(invalid.operation|cannot.perform|not.allowed)",
+            "invalid_operation",
+            "The requested operation is not valid for this mailbox.",
+        ),
+        # Hold-related errors
+        (
+            r"(hold|retention|litigation)",
+            "hold_error",
+            "Operation blocked due to hold or retention policy.",
+        ),
+        # Connection errors
+        (
+            r"(connection|network|timeout)",
+            "connection",
+            "Connection or network error occurred.",
+        ),
+    ]
+]
+
 
 class ParseError(Exception):
     """Raised when PowerShell output cannot be parsed."""
@@ -47,7 +137,7 @@ def parse_json_output(output: str) -> list[dict[str, Any]] | dict[str, Any]:
         return []
 
     try:
-        parsed = json.loads(cleaned)
+        parsed = _loads(cleaned)
 
         # Ensure we return list or dict
         if isinstance(parsed, list):
@@ -65,6 +155,23 @@ def parse_json_output(output: str) -> list[dict[str, Any]] | dict[str, Any]:
         raise ParseError(error_msg, cleaned) from e
 
 
+def _loads(text: str) -> Any:
+    """Decode JSON text, using orjson when installed.
+
+    Text with integers that may not fit in 64 bits goes straight to the stdlib
+    parser, which decodes them as exact ints. Input orjson rejects is decoded
+    again with the stdlib parser, which also accepts NaN/Infinity and reports
+    line and column for real errors.
+    """
+    if orjson is not None and _WIDE_INT_RE.search(text) is None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+
+    return json.loads(text)
+
+
 def _clean_output(output: str) -> str:
     """Clean PowerShell output for JSON parsing.
 
@@ -76,31 +183,30 @@ def _clean_output(output: str) -> str:
     Returns:
         Cleaned string ready for JSON parsing
     """
-    lines = output.strip().split("\n")
-    cleaned_lines = []
-
-    for line in lines:
-        # Skip empty lines
-        if not line.strip():
-            continue
-
-        # Skip PowerShell progress/warning messages
-        if line.startswith("WARNING:") or line.startswith("VERBOSE:"):
-            continue
-
-        # Skip Exchange Online banner lines
-        if "Exchange Online PowerShell" in line:
-            continue
-
-        cleaned_lines.append(line)
-
-    cleaned = "\n".join(cleaned_lines).strip()
-
-    # Handle case where output is just whitespace or comments
-    if not cleaned:
-        return ""
-
-    return cleaned
+    stripped = output.strip()
+
+    # Fast path: already-clean JSON (e.g. ConvertTo-Json -Compress) needs no
+    # line filtering
+    if (
+        stripped[:1] in _JSON_START_CHARS
+        and "WARNING:" not in stripped
+        and "VERBOSE:" not in stripped
+        and "Exchange Online PowerShell" not in stripped
+        and not _BLANK_LINE_RE.search(stripped)
+    ):
+        return stripped
+
+    # Drop empty lines, PowerShell progress/warning messages and
+    # Exchange Online banner lines
+    return "\n".join(
+        [
+            line
+            for line in stripped.split("\n")
+            if line.strip()
+            and not line.startswith(_SKIPPED_LINE_PREFIXES)
+            and "Exchange Online PowerShell" not in line
+        ]
+    ).strip()
 
 
 def _format_json_error(json_str: str, error: json.JSONDecodeError) -> str:
@@ -143,52 +249,65 @@ def normalize_property_names(
         to_snake_case: Convert to snake_case (default True)
 
     Returns:
-        Data with normalized property names
+        Data with normalized property names; ``data`` itself, uncopied,
+        when to_snake_case is False
     """
+    if not to_snake_case:
+        return data
+
     if isinstance(data, list):
-        return [normalize_property_names(item, to_snake_case) for item in data]
+        return [normalize_property_names(item) for item in data]
 
     if not isinstance(data, dict):
         return data
 
-    result = {}
-    for key, value in data.items():
-        # Convert key
-        if to_snake_case:
-            new_key = _pascal_to_snake(key)
-        else:
-            new_key = key
-
-        # Recursively normalize nested structures
-        if isinstance(value, dict):
-            result[new_key] = normalize_property_names(value, to_snake_case)
-        elif isinstance(value, list):
-            result[new_key] = [
-                normalize_property_names(item, to_snake_case)
-                if isinstance(item, dict)
-                else item
+    # Recursively normalize nested dicts, including dicts inside lists
+    return {
+        _pascal_to_snake(key): (
+            normalize_property_names(value)
+            if isinstance(value, dict)
+            else [
+                normalize_property_names(item) if isinstance(item, dict) else item
                 for item in value
             ]
-        else:
-            result[new_key] = value
-
-    return result
+            if isinstance(value, list)
+            else value
+        )
+        for key, value in data.items()
+    }
 
 
+@lru_cache(maxsize=1024)
 def _pascal_to_snake(name: str) -> str:
     """Convert PascalCase to snake_case.
 
+    Cached: PowerShell returns the same few dozen property names for every
+    record in a result set.
+
     Args:
         name: PascalCase string
 
     Returns:
         snake_case string
     """
-    # Insert underscore before uppercase letters (except at start)
-    s1 = re.sub(r"(.)([A-Z][a-z]+)", r"\1_\2", name)
-    # Insert underscore before uppercase letters followed by lowercase
-    s2 = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", s1)
-    return s2.lower()
+    out: list[str] = []
+    last = len(name) - 1
+    prev = ""
+    for i, char in enumerate(name):
+        # Underscore before a capital that follows a lowercase letter or digit,
+        # or that starts a capitalized word (except at start)
+        if (
+            i
+            and "A" <= char <= "Z"
+            and (
+                prev in _SNAKE_BOUNDARY_CHARS
+                or (prev != "\n" and i < last and name[i + 1] in _ASCII_LOWERCASE)
+            )
+        ):
+            out.append("_")
+        out.append(char)
+        prev = char
+    return "".join(out).lower()
 
 
 def extract_error_details(error_output: str) -> dict[str, Any]:
@@ -210,61 +329,14 @@ def extract_error_details(error_output: str) -> dict[str, Any]:
     if not error_output:
         return result
 
-    # Common Exchange Online error patterns
-    error_patterns = [
-        # Throttling errors
-        (
-            r"throttl",
-            "throttling",
-            "Request throttled. Please wait before retrying.",
-        ),
-        # Session errors
-        (
-            r"session.*(expired|closed|invalid)",
-            "session_expired",
-            "Exchange Online session has expired. Reconnection required.",
-        ),
-        # Authentication errors
-        (
-            r"(unauthorized|authentication|access.denied)",
-            "authentication",
-            "Authentication failed or access denied.",
-        ),
-        # Not found errors
-        (
-            r"(couldn't be found|does not exist|not found)",
-            "not_found",
-            "The requested mailbox or resource was not found.",
-        ),
-        # Invalid operation
-        (
-            r"(invalid.operation|cannot.perform|not.allowed)",
-            "invalid_operation",
-            "The requested operation is not valid for this mailbox.",
-        ),
-        # Hold-related errors
-        (
-            r"(hold|retention|litigation)",
-            "hold_error",
-            "Operation blocked due to hold or retention policy.",
-        ),
-        # Connection errors
-        (
-            r"(connection|network|timeout)",
-            "connection",
-            "Connection or network error occurred.",
-        ),
-    ]
-
-    error_lower = error_output.lower()
-    for pattern, error_type, friendly_message in error_patterns:
-        if re.search(pattern, error_lower, re.IGNORECASE):
+    for pattern, error_type, friendly_message in _ERROR_PATTERNS:
+        if pattern.search(error_output):
             result["error_type"] = error_type
             result["message"] = friendly_message
             break
 
     # Try to extract XML error details (Exchange returns XML errors sometimes)
-    xml_match = re.search(r"<Message>(.*?)</Message>", error_output, re.DOTALL)
+    xml_match = _XML_MESSAGE_RE.search(error_output)
     if xml_match:
         result["details"] = xml_match.group(1).strip()
 
@@ -284,7 +356,7 @@ def parse_size_value(size_str: str) -> int | None:
         return None
 
     # Try to extract bytes value in parentheses
-    bytes_match = re.search(r"\(([0-9,]+)\s*bytes?\)", size_str, re.IGNORECASE)
+    bytes_match = _SIZE_BYTES_RE.search(size_str)
     if bytes_match:
         bytes_str = bytes_match.group(1).replace(",", "")
         try:
@@ -293,7 +365,7 @@ def parse_size_value(size_str: str) -> int | None:
             pass
 
     # Try to parse human-readable format
-    size_match = re.match(r"([0-9.]+)\s*(B|KB|MB|GB|TB)", size_str, re.IGNORECASE)
+    size_match = _SIZE_UNIT_RE.match(size_str)
     if size_match:
         value = float(size_match.group(1))
         unit = size_match.group(2).upper()
@@ -336,33 +408,19 @@ def parse_hold_guids(in_place_holds: list[str] | None) -> list[dict[str, str]]:
         if not hold:
             continue
 
-        hold_info: dict[str, str] = {
-            "hold_id": hold,
-            "hold_type": "unknown",
-            "hold_name": None,
-        }
-
-        # Identify hold type by prefix
-        if hold.startswith("UniH"):
-            hold_info["hold_type"] = "unified_hold"
-            hold_info["hold_name"] = "Unified eDiscovery Hold"
-        elif hold.startswith("mbx"):
-            hold_info["hold_type"] = "mailbox_hold"
-            hold_info["hold_name"] = "Mailbox Hold"
-        elif hold.startswith("skp"):
-            hold_info["hold_type"] = "skype_hold"
-            hold_info["hold_name"] = "Skype for Business Hold"
-        elif hold.startswith("cld"):
-            hold_info["hold_type"] = "cloud_hold"
-            hold_info["hold_name"] = "Cloud Hold"
-        elif hold.startswith("grp"):
-            hold_info["hold_type"] = "group_hold"
-            hold_info["hold_name"] = "Group Hold"
-        elif "-" in hold and len(hold) == 36:
-            # Looks like a plain GUID - likely a retention policy
-            hold_info["hold_type"] = "retention_policy"
-            hold_info["hold_name"] = "Retention Policy"
-
-        result.append(hold_info)
+        # Identify hold type by prefix ("UniH" is the only 4-character one)
+        hold_type = _HOLD_TYPES_BY_PREFIX.get(hold[:4]) or _HOLD_TYPES_BY_PREFIX.get(hold[:3])
+        if hold_type is None:
+            # A plain GUID is likely a retention policy
+            is_guid = "-" in hold and len(hold) == 36
+            hold_type = _RETENTION_POLICY_HOLD_TYPE if is_guid else _UNKNOWN_HOLD_TYPE
+
+        result.append(
+            {
+                "hold_id": hold,
+                "hold_type": hold_type[0],
+                "hold_name": hold_type[1],
+            }
+        )
 
     return result
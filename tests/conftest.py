@@ -9,9 +9,13 @@ from unittest.mock import AsyncMock, MagicMock
 import pytest
 
 from src.data.models import InactiveMailbox
+from src.utils.error_handler import ErrorHandler
 
+# Sample data fixtures are session-scoped: they are built once and shared, so
+# tests must treat them as read-only.
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_mailbox() -> InactiveMailbox:
     """Create a sample inactive mailbox for testing."""
     return InactiveMailbox(
@@ -33,7 +37,7 @@ def sample_mailbox() -> InactiveMailbox:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_mailbox_no_holds() -> InactiveMailbox:
     """Create a sample mailbox without holds."""
     return InactiveMailbox(
@@ -52,7 +56,7 @@ def sample_mailbox_no_holds() -> InactiveMailbox:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_mailbox_list(
     sample_mailbox: InactiveMailbox, sample_mailbox_no_holds: InactiveMailbox
 ) -> list[InactiveMailbox]:
@@ -60,6 +64,15 @@ def sample_mailbox_list(
     return [sample_mailbox, sample_mailbox_no_holds]
 
 
+@pytest.fixture(scope="session")
+def error_handler() -> ErrorHandler:
+    """Create one error handler shared by the whole test session.
+
+    Tests that register callbacks must restore the handler's callbacks afterwards.
+    """
+    return ErrorHandler()
+
+
 @pytest.fixture
 def mock_session() -> MagicMock:
     """Create a mock session manager."""
@@ -92,7 +105,7 @@ def mock_exchange_connection() -> MagicMock:
     return connection
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_config() -> dict[str, Any]:
     """Create sample configuration dictionary."""
     return {
@@ -119,7 +132,7 @@ def sample_config() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_csv_content() -> str:
     """Create sample CSV content for bulk operations."""
     return """SourceMailbox,TargetUPN,TargetName,IncludeArchive
@@ -2,8 +2,16 @@
 Unit tests for exception handling.
 """
 
+import copy
+import json
+import logging
+import pickle
+from collections.abc import Iterator
+from datetime import datetime
+
 import pytest
 
+import src.utils.error_handler as error_handler_module
 from src.utils.exceptions import (
     AppException,
     AuthenticationError,
@@ -19,6 +27,7 @@ from src.utils.exceptions import (
     RECOVERY_SUGGESTIONS,
 )
 from src.utils.error_handler import (
+    BatchErrorResult,
     ErrorHandler,
     ErrorResult,
     ErrorSeverity,
@@ -29,156 +38,212 @@ from src.utils.error_handler import (
 )
 
 
-class TestErrorCodes:
-    """Tests for ErrorCode enum."""
-
-    def test_connection_error_codes(self) -> None:
-        """Test connection error codes are in 1xxx range."""
-        assert ErrorCode.CONNECTION_FAILED.value == 1001
-        assert ErrorCode.CONNECTION_TIMEOUT.value == 1002
-        assert ErrorCode.CONNECTION_LOST.value == 1003
+# Tests for ErrorCode enum
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        # Connection errors: 1xxx
+        (ErrorCode.CONNECTION_FAILED, 1001),
+        (ErrorCode.CONNECTION_TIMEOUT, 1002),
+        (ErrorCode.CONNECTION_LOST, 1003),
+        # Auth errors: 2xxx
+        (ErrorCode.AUTH_FAILED, 2001),
+        (ErrorCode.AUTH_EXPIRED, 2002),
+        (ErrorCode.AUTH_CERTIFICATE_ERROR, 2004),
+        # Validation errors: 4xxx
+        (ErrorCode.VALIDATION_FAILED, 4001),
+        (ErrorCode.VALIDATION_UPN_EXISTS, 4002),
+    ],
+)
+def test_error_code_values(code: ErrorCode, expected: int) -> None:
+    """Test error codes keep their numeric values within their range."""
+    assert code.value == expected
 
-    def test_auth_error_codes(self) -> None:
-        """Test auth error codes are in 2xxx range."""
-        assert ErrorCode.AUTH_FAILED.value == 2001
-        assert ErrorCode.AUTH_EXPIRED.value == 2002
-        assert ErrorCode.AUTH_CERTIFICATE_ERROR.value == 2004
 
-    def test_validation_error_codes(self) -> None:
-        """Test validation error codes are in 4xxx range."""
-        assert ErrorCode.VALIDATION_FAILED.value == 4001
-        assert ErrorCode.VALIDATION_UPN_EXISTS.value == 4002
+def test_all_codes_have_messages() -> None:
+    """Test all error codes have messages."""
+    missing = set(ErrorCode) - ERROR_MESSAGES.keys()
+    assert not missing, f"Missing messages for: {sorted(code.name for code in missing)}"
 
-    def test_all_codes_have_messages(self) -> None:
-        """Test all error codes have messages."""
-        for code in ErrorCode:
-            assert code in ERROR_MESSAGES, f"Missing message for {code.name}"
 
+# Tests for AppException base class
+def test_create_exception() -> None:
+    """Test creating basic exception."""
+    exc = AppException(message="Test error", code=ErrorCode.UNKNOWN_ERROR)
+    assert str(exc) == "Test error"
+    assert exc.code == ErrorCode.UNKNOWN_ERROR
 
-class TestAppException:
-    """Tests for AppException base class."""
 
-    def test_create_exception(self) -> None:
-        """Test creating basic exception."""
-        exc = AppException(message="Test error", code=ErrorCode.UNKNOWN_ERROR)
-        assert str(exc) == "Test error"
-        assert exc.code == ErrorCode.UNKNOWN_ERROR
+def test_exception_args() -> None:
+    """Test the message is carried in args, including template messages."""
+    assert AppException("Test error").args == ("Test error",)
+    exc = AppException(code=ErrorCode.CONNECTION_FAILED)
+    assert exc.args == (exc.message,)
 
-    def test_default_message(self) -> None:
-        """Test default message from templates."""
-        exc = AppException(code=ErrorCode.CONNECTION_FAILED)
-        assert "connect" in exc.message.lower()
 
-    def test_exception_with_details(self) -> None:
-        """Test exception with details."""
-        exc = AppException(
-            code=ErrorCode.VALIDATION_FAILED,
-            details={"field": "email", "value": "invalid"},
-        )
-        assert exc.details["field"] == "email"
-
-    def test_exception_with_cause(self) -> None:
-        """Test exception chaining."""
-        original = ValueError("Original error")
-        exc = AppException(code=ErrorCode.INTERNAL_ERROR, cause=original)
-        assert exc.cause is original
-
-    def test_user_message_property(self) -> None:
-        """Test user_message property."""
-        exc = AppException(message="Custom message", code=ErrorCode.AUTH_FAILED)
-        assert exc.user_message == "Custom message"
-
-    def test_suggestions_property(self) -> None:
-        """Test suggestions property."""
-        exc = AppException(code=ErrorCode.AUTH_FAILED)
-        suggestions = exc.suggestions
-        assert isinstance(suggestions, list)
-
-    def test_error_code_property(self) -> None:
-        """Test error_code numeric property."""
-        exc = AppException(code=ErrorCode.CONNECTION_TIMEOUT)
-        assert exc.error_code == 1002
-
-    def test_to_dict(self) -> None:
-        """Test serialization to dictionary."""
-        exc = AppException(
-            message="Test",
-            code=ErrorCode.CONFIG_INVALID,
-            details={"path": "/config.yaml"},
-        )
-        data = exc.to_dict()
-        assert data["code"] == ErrorCode.CONFIG_INVALID.value
-        assert data["code_name"] == "CONFIG_INVALID"
-        assert data["message"] == "Test"
+def test_set_message() -> None:
+    """Test the message can be replaced after creation."""
+    exc = AppException(code=ErrorCode.AUTH_FAILED)
+    exc.message = "Custom message"
+    assert str(exc) == "Custom message"
+    assert exc.args == ("Custom message",)
 
 
-class TestSpecializedExceptions:
-    """Tests for specialized exception classes."""
+def test_default_message() -> None:
+    """Test default message from templates."""
+    exc = AppException(code=ErrorCode.CONNECTION_FAILED)
+    assert "connect" in exc.message.lower()
 
-    def test_connection_error(self) -> None:
-        """Test ConnectionError."""
-        exc = ConnectionError(code=ErrorCode.CONNECTION_TIMEOUT)
-        assert exc.code == ErrorCode.CONNECTION_TIMEOUT
-
-    def test_authentication_error(self) -> None:
-        """Test AuthenticationError."""
-        exc = AuthenticationError(code=ErrorCode.AUTH_CERTIFICATE_ERROR)
-        assert exc.code == ErrorCode.AUTH_CERTIFICATE_ERROR
-
-    def test_validation_error_with_field(self) -> None:
-        """Test ValidationError with field."""
-        exc = ValidationError(
-            message="Invalid email",
-            code=ErrorCode.VALIDATION_FAILED,
-            field="email",
-        )
-        assert exc.details["field"] == "email"
 
-    def test_recovery_error_with_mailbox(self) -> None:
-        """Test RecoveryError with mailbox."""
-        exc = RecoveryError(
-            code=ErrorCode.RECOVERY_FAILED,
-            mailbox="user@contoso.com",
-        )
-        assert exc.details["mailbox"] == "user@contoso.com"
-
-    def test_restore_error_with_mailboxes(self) -> None:
-        """Test RestoreError with source and target."""
-        exc = RestoreError(
-            code=ErrorCode.RESTORE_FAILED,
-            source_mailbox="source@contoso.com",
-            target_mailbox="target@contoso.com",
-        )
-        assert exc.details["source_mailbox"] == "source@contoso.com"
-        assert exc.details["target_mailbox"] == "target@contoso.com"
-
-    def test_bulk_operation_error(self) -> None:
-        """Test BulkOperationError with counts."""
-        exc = BulkOperationError(
-            code=ErrorCode.BULK_PARTIAL_FAILURE,
-            succeeded=8,
-            failed=2,
-        )
-        assert exc.details["succeeded"] == 8
-        assert exc.details["failed"] == 2
-
-    def test_powershell_error(self) -> None:
-        """Test PowerShellError with command."""
-        exc = PowerShellError(
-            code=ErrorCode.POWERSHELL_EXECUTION_FAILED,
-            command="Get-Mailbox",
-            stderr="Access denied",
-        )
-        assert exc.details["command"] == "Get-Mailbox"
-        assert exc.details["stderr"] == "Access denied"
+def test_exception_with_details() -> None:
+    """Test exception with details."""
+    exc = AppException(
+        code=ErrorCode.VALIDATION_FAILED,
+        details={"field": "email", "value": "invalid"},
+    )
+    assert exc.details["field"] == "email"
+
+
+def test_exception_with_cause() -> None:
+    """Test exception chaining."""
+    original = ValueError("Original error")
+    exc = AppException(code=ErrorCode.INTERNAL_ERROR, cause=original)
+    assert exc.cause is original
+
+
+def test_user_message_property() -> None:
+    """Test user_message property."""
+    exc = AppException(message="Custom message", code=ErrorCode.AUTH_FAILED)
+    assert exc.user_message == "Custom message"
+
+
+def test_suggestions_property() -> None:
+    """Test suggestions property."""
+    exc = AppException(code=ErrorCode.AUTH_FAILED)
+    suggestions = exc.suggestions
+    assert isinstance(suggestions, (list, tuple))
+
+
+def test_error_code_property() -> None:
+    """Test error_code numeric property."""
+    exc = AppException(code=ErrorCode.CONNECTION_TIMEOUT)
+    assert exc.error_code == 1002
+
+
+def test_to_dict() -> None:
+    """Test serialization to dictionary."""
+    exc = AppException(
+        message="Test",
+        code=ErrorCode.CONFIG_INVALID,
+        details={"path": "/config.yaml"},
+    )
+    data = exc.to_dict()
+    assert data["code"] == ErrorCode.CONFIG_INVALID.value
+    assert data["code_name"] == "CONFIG_INVALID"
+    assert data["message"] == "Test"
+
+
+# Tests for specialized exception classes
+def test_connection_error() -> None:
+    """Test ConnectionError."""
+    exc = ConnectionError(code=ErrorCode.CONNECTION_TIMEOUT)
+    assert exc.code == ErrorCode.CONNECTION_TIMEOUT
+
+
+def test_authentication_error() -> None:
+    """Test AuthenticationError."""
+    exc = AuthenticationError(code=ErrorCode.AUTH_CERTIFICATE_ERROR)
+    assert exc.code == ErrorCode.AUTH_CERTIFICATE_ERROR
+
+
+def test_validation_error_with_field() -> None:
+    """Test ValidationError with field."""
+    exc = ValidationError(
+        message="Invalid email",
+        code=ErrorCode.VALIDATION_FAILED,
+        field="email",
+    )
+    assert exc.details["field"] == "email"
+
+
+def test_recovery_error_with_mailbox() -> None:
+    """Test RecoveryError with mailbox."""
+    exc = RecoveryError(
+        code=ErrorCode.RECOVERY_FAILED,
+        mailbox="user@contoso.com",
+    )
+    assert exc.details["mailbox"] == "user@contoso.com"
+
+
+def test_restore_error_with_mailboxes() -> None:
+    """Test RestoreError with source and target."""
+    exc = RestoreError(
+        code=ErrorCode.RESTORE_FAILED,
+        source_mailbox="source@contoso.com",
+        target_mailbox="target@contoso.com",
+    )
+    assert exc.details["source_mailbox"] == "source@contoso.com"
+    assert exc.details["target_mailbox"] == "target@contoso.com"
+
+
+def test_bulk_operation_error() -> None:
+    """Test BulkOperationError with counts."""
+    exc = BulkOperationError(
+        code=ErrorCode.BULK_PARTIAL_FAILURE,
+        succeeded=8,
+        failed=2,
+    )
+    assert exc.details["succeeded"] == 8
+    assert exc.details["failed"] == 2
+
+
+def test_powershell_error() -> None:
+    """Test PowerShellError with command."""
+    exc = PowerShellError(
+        code=ErrorCode.POWERSHELL_EXECUTION_FAILED,
+        command="Get-Mailbox",
+        stderr="Access denied",
+    )
+    assert exc.details["command"] == "Get-Mailbox"
+    assert exc.details["stderr"] == "Access denied"
+
+
+@pytest.mark.parametrize(
+    "exc",
+    [
+        ValidationError("bad", field="upn"),
+        RestoreError(source_mailbox="src@contoso.com", target_mailbox="dst@contoso.com"),
+        AppException(code=ErrorCode.AUTH_FAILED, cause=ValueError("inner")),
+    ],
+)
+@pytest.mark.parametrize(
+    "clone",
+    [copy.copy, copy.deepcopy, lambda exc: pickle.loads(pickle.dumps(exc))],
+    ids=["copy", "deepcopy", "pickle"],
+)
+def test_exception_copy_and_pickle(exc: AppException, clone) -> None:
+    """Test copies and pickle round-trips keep the message, code and details."""
+    restored = clone(exc)
+    assert type(restored) is type(exc)
+    assert restored.message == exc.message
+    assert restored.code == exc.code
+    assert restored.details == exc.details
+    assert restored.args == exc.args
+    assert (restored.cause is None) == (exc.cause is None)
 
 
 class TestErrorHandler:
     """Tests for ErrorHandler class."""
 
-    def test_handle_app_exception(self) -> None:
+    @pytest.fixture
+    def handler(self, error_handler: ErrorHandler) -> Iterator[ErrorHandler]:
+        """Provide the shared handler, restoring its callbacks after each test."""
+        callbacks = error_handler._error_callbacks, error_handler._trusted_callbacks
+        yield error_handler
+        error_handler._error_callbacks, error_handler._trusted_callbacks = callbacks
+
+    def test_handle_app_exception(self, handler: ErrorHandler) -> None:
         """Test handling AppException."""
-        handler = ErrorHandler()
         exc = AuthenticationError(code=ErrorCode.AUTH_FAILED)
         result = handler.handle(exc)
 
@@ -186,27 +251,30 @@ class TestErrorHandler:
         assert result.code == ErrorCode.AUTH_FAILED
         assert isinstance(result.message, str)
 
-    def test_handle_unknown_exception(self) -> None:
+    def test_handle_unknown_exception(self, handler: ErrorHandler) -> None:
         """Test handling standard Python exception."""
-        handler = ErrorHandler()
         exc = ValueError("Invalid value")
         result = handler.handle(exc)
 
         assert result.success is False
         assert result.code == ErrorCode.VALIDATION_FAILED
 
-    def test_handle_timeout_error(self) -> None:
+    def test_handle_timeout_error(self, handler: ErrorHandler) -> None:
         """Test handling TimeoutError."""
-        handler = ErrorHandler()
         exc = TimeoutError("Connection timed out")
         result = handler.handle(exc)
 
         assert result.code == ErrorCode.CONNECTION_TIMEOUT
 
-    def test_severity_determination(self) -> None:
-        """Test severity level determination."""
-        handler = ErrorHandler()
+    def test_handle_exception_subclass(self, handler: ErrorHandler) -> None:
+        """Test standard exception subclasses map via their base class."""
+        exc = ConnectionRefusedError("Connection refused")
+        result = handler.handle(exc)
+
+        assert result.code == ErrorCode.CONNECTION_FAILED
 
+    def test_severity_determination(self, handler: ErrorHandler) -> None:
+        """Test severity level determination."""
         # Critical
         exc = AppException(code=ErrorCode.INTERNAL_ERROR)
         result = handler.handle(exc)
@@ -217,10 +285,8 @@ class TestErrorHandler:
         result = handler.handle(exc)
         assert result.severity == ErrorSeverity.WARNING
 
-    def test_can_retry(self) -> None:
+    def test_can_retry(self, handler: ErrorHandler) -> None:
         """Test retry capability detection."""
-        handler = ErrorHandler()
-
         # Retryable
         exc = ConnectionError(code=ErrorCode.CONNECTION_TIMEOUT)
         result = handler.handle(exc)
@@ -231,10 +297,8 @@ class TestErrorHandler:
         result = handler.handle(exc)
         assert result.can_retry is False
 
-    def test_safe_execute_success(self) -> None:
+    def test_safe_execute_success(self, handler: ErrorHandler) -> None:
         """Test safe_execute with successful function."""
-        handler = ErrorHandler()
-
         def success_func(x: int) -> int:
             return x * 2
 
@@ -242,10 +306,8 @@ class TestErrorHandler:
         assert result == 10
         assert error is None
 
-    def test_safe_execute_failure(self) -> None:
+    def test_safe_execute_failure(self, handler: ErrorHandler) -> None:
         """Test safe_execute with failing function."""
-        handler = ErrorHandler()
-
         def fail_func() -> None:
             raise ValueError("Test error")
 
@@ -254,9 +316,8 @@ class TestErrorHandler:
         assert error is not None
         assert error.success is False
 
-    def test_callback_registration(self) -> None:
+    def test_callback_registration(self, handler: ErrorHandler) -> None:
         """Test error callback registration."""
-        handler = ErrorHandler()
         received_errors: list[ErrorResult] = []
 
         def callback(result: ErrorResult) -> None:
@@ -268,52 +329,152 @@ class TestErrorHandler:
         assert len(received_errors) == 1
         assert received_errors[0].success is False
 
+    def test_trusted_callback_registration(self, handler: ErrorHandler) -> None:
+        """Test trusted callbacks are notified and can be unregistered."""
+        received_errors: list[ErrorResult] = []
 
-class TestErrorFormatting:
-    """Tests for error formatting functions."""
-
-    def test_format_for_display(self) -> None:
-        """Test formatting for UI display."""
-        result = ErrorResult(
-            success=False,
-            message="Connection failed",
-            code=ErrorCode.CONNECTION_FAILED,
-            suggestions=["Check network", "Try again"],
-            can_retry=True,
-        )
-        output = format_error_for_display(result)
-
-        assert "Connection failed" in output
-        assert "Check network" in output
-        assert "retried" in output.lower()
-
-    def test_format_for_log(self) -> None:
-        """Test formatting for log files."""
-        result = ErrorResult(
-            success=False,
-            message="Auth failed",
-            code=ErrorCode.AUTH_FAILED,
-            severity=ErrorSeverity.ERROR,
-            details={"user": "test@contoso.com"},
-        )
-        output = format_error_for_log(result)
-
-        assert "AUTH_FAILED" in output
-        assert "ERROR" in output
-        assert "user" in output
+        def callback(result: ErrorResult) -> None:
+            received_errors.append(result)
 
+        handler.register_callback(callback, trusted=True)
+        handler.handle(ValueError("Test"))
+        handler.unregister_callback(callback)
+        handler.handle(ValueError("Test"))
 
-class TestGlobalErrorHandler:
-    """Tests for global error handler functions."""
+        assert len(received_errors) == 1
 
-    def test_get_error_handler_singleton(self) -> None:
-        """Test global handler is singleton."""
-        handler1 = get_error_handler()
-        handler2 = get_error_handler()
-        assert handler1 is handler2
+    def test_handle_batch(self, handler: ErrorHandler) -> None:
+        """Test batch handling returns per-exception results and notifies once."""
+        received_errors: list[ErrorResult] = []
+        handler.register_callback(received_errors.append)
+
+        results = handler.handle_batch(
+            [
+                ValidationError(field="upn"),
+                ValidationError(field="smtp"),
+                AppException(code=ErrorCode.RATE_LIMITED),
+            ]
+        )
 
-    def test_handle_error_convenience(self) -> None:
-        """Test handle_error convenience function."""
-        result = handle_error(ValueError("Test"))
-        assert result.success is False
-        assert isinstance(result, ErrorResult)
+        assert [r.code for r in results] == [
+            ErrorCode.VALIDATION_FAILED,
+            ErrorCode.VALIDATION_FAILED,
+            ErrorCode.RATE_LIMITED,
+        ]
+        assert len(received_errors) == 1
+        batch = received_errors[0]
+        assert isinstance(batch, BatchErrorResult)
+        assert batch.results == results
+        assert batch.details["codes"] == {"VALIDATION_FAILED": 2, "RATE_LIMITED": 1}
+        assert batch.can_retry is True
+
+    def test_handle_batch_traceback_from_most_severe(
+        self, handler: ErrorHandler, caplog: pytest.LogCaptureFixture
+    ) -> None:
+        """Test the batch log carries the traceback of the exception that set its level."""
+        critical = AppException(code=ErrorCode.INTERNAL_ERROR)
+
+        with caplog.at_level(logging.INFO):
+            handler.handle_batch([AppException(code=ErrorCode.RATE_LIMITED), critical])
+
+        (record,) = [r for r in caplog.records if r.getMessage().startswith("Bulk:")]
+        assert record.levelno == logging.CRITICAL
+        assert record.exc_info is not None
+        assert record.exc_info[1] is critical
+
+    def test_register_non_callable(self, handler: ErrorHandler) -> None:
+        """Test registering a non-callable callback is rejected."""
+        with pytest.raises(TypeError):
+            handler.register_callback("not callable")  # type: ignore[arg-type]
+
+
+# Tests for error formatting functions
+def test_format_for_display() -> None:
+    """Test formatting for UI display."""
+    result = ErrorResult(
+        success=False,
+        message="Connection failed",
+        code=ErrorCode.CONNECTION_FAILED,
+        suggestions=["Check network", "Try again"],
+        can_retry=True,
+    )
+    output = format_error_for_display(result)
+
+    assert "Connection failed" in output
+    assert "Check network" in output
+    assert "retried" in output.lower()
+
+
+def test_format_for_log() -> None:
+    """Test formatting for log files."""
+    result = ErrorResult(
+        success=False,
+        message="Auth failed",
+        code=ErrorCode.AUTH_FAILED,
+        severity=ErrorSeverity.ERROR,
+        details={"user": "test@contoso.com"},
+    )
+    output = format_error_for_log(result)
+
+    assert "AUTH_FAILED" in output
+    assert "ERROR" in output
+    assert "user" in output
+
+
+@pytest.mark.parametrize(
+    ("details", "expected_details"),
+    [
+        ({"batch": 3}, {"batch": 3}),
+        ({3: "row", None: "missing"}, {"3": "row", "null": "missing"}),
+    ],
+    ids=["str-keys", "non-str-keys"],
+)
+def test_to_json_matches_to_dict(details: dict, expected_details: dict) -> None:
+    """Test JSON serialization carries the same fields as to_dict."""
+    result = ErrorResult(
+        success=False,
+        message="Rate limited",
+        code=ErrorCode.RATE_LIMITED,
+        severity=ErrorSeverity.WARNING,
+        details=details,
+    )
+
+    assert json.loads(result.to_json()) == {**result.to_dict(), "details": expected_details}
+
+
+@pytest.mark.parametrize(
+    "details",
+    [
+        {3: "row", 4.5: "ratio", None: "missing"},
+        {"when": datetime(2024, 1, 2, 3, 4, 5)},
+        {"size_bytes": 2**70},
+        {"user": "Zoë Müller"},
+        {"ratio": float("nan"), "limit": float("inf")},
+        {"code": ErrorCode.RATE_LIMITED},
+    ],
+    ids=["non-str-keys", "datetime", "big-int", "non-ascii", "non-finite", "enum"],
+)
+def test_to_json_independent_of_orjson(
+    details: dict, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test to_json output does not depend on whether orjson is installed."""
+    result = ErrorResult(success=False, message="Failed", details=details)
+
+    with_orjson = result.to_json()
+    monkeypatch.setattr(error_handler_module, "orjson", None)
+    assert result.to_json() == with_orjson
+
+
+# Tests for global error handler functions
+def test_get_error_handler_singleton() -> None:
+    """Test global handler is singleton."""
+    handler1 = get_error_handler()
+    handler2 = get_error_handler()
+    assert handler1 is handler2
+
+
+def test_handle_error_convenience() -> None:
+    """Test handle_error convenience function."""
+    result = handle_error(ValueError("Test"))
+    assert result.success is False
+    assert isinstance(result, ErrorResult)
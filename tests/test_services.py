@@ -14,12 +14,18 @@ from src.core.onboarding import OnboardingWizard, OnboardingStep, OnboardingStat
 class TestOnboardingWizard:
     """Tests for OnboardingWizard."""
 
-    @pytest.fixture
-    def wizard(self, tmp_path) -> OnboardingWizard:
-        """Create wizard with temporary config path."""
-        config_path = str(tmp_path / "config.yaml")
+    @pytest.fixture(scope="module")
+    def wizard(self, tmp_path_factory) -> OnboardingWizard:
+        """Create one wizard for the module, with a temporary config path."""
+        config_path = str(tmp_path_factory.mktemp("onboarding") / "config.yaml")
         return OnboardingWizard(config_path=config_path)
 
+    @pytest.fixture(autouse=True)
+    def _reset_wizard(self, wizard: OnboardingWizard, tmp_path) -> None:
+        """Give each test a fresh wizard state and its own config path."""
+        wizard._state = OnboardingState()
+        wizard._config_path = tmp_path / "config.yaml"
+
     def test_initial_state(self, wizard: OnboardingWizard) -> None:
         """Test initial wizard state."""
         assert wizard.current_step == OnboardingStep.WELCOME
@@ -96,6 +102,11 @@ class TestOnboardingWizard:
         errors = wizard.validate_current_step()
         assert any("GUID" in e for e in errors)
 
+        # Right shape but not hexadecimal
+        wizard.set_value("tenant_id", "zzzzzzzz-1234-1234-1234-123456789012")
+        errors = wizard.validate_current_step()
+        assert any("GUID" in e for e in errors)
+
     def test_skip_certificate_step(self, wizard: OnboardingWizard) -> None:
         """Test skipping certificate step when using secret."""
         wizard.set_value("auth_method", "secret")
@@ -196,3 +207,14 @@ class TestSummaryStats:
         stats = SummaryStats(total_mailboxes=0)
         assert stats.hold_percentage == 0.0
         assert stats.recovery_percentage == 0.0
+
+    def test_stats_are_immutable(self) -> None:
+        """Test that stats cannot drift from their precomputed percentages."""
+        from dataclasses import FrozenInstanceError
+
+        from src.core.statistics_service import SummaryStats
+
+        stats = SummaryStats(total_mailboxes=10, with_holds=5)
+        with pytest.raises(FrozenInstanceError):
+            stats.with_holds = 10  # type: ignore[misc]
+        assert stats.hold_percentage == 50.0
@@ -0,0 +1,156 @@
+"""
+Unit tests for utility modules.
+"""
+
+import logging
+import os
+import queue
+import sys
+import uuid
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from pathlib import Path
+
+import pytest
+
+import src.utils.logging as app_logging
+from src.utils.command_builder import CommandBuilder
+from src.utils.logging import JSONFileHandler, JSONFormatter
+from src.utils.ps_parser import parse_json_output
+
+
+class TestCommandBuilder:
+    """Tests for CommandBuilder."""
+
+    def test_check_smtp_exists(self) -> None:
+        """Test a valid SMTP address is embedded in the filter."""
+        cmd = CommandBuilder().build_check_smtp_exists("john.smith@contoso.com")
+        assert "smtp:john.smith@contoso.com'" in cmd
+
+    @pytest.mark.parametrize(
+        "smtp_address",
+        [
+            "john.smith@contoso.com\n",
+            "john.smith@contoso.com' ; Remove-Mailbox x",
+            "not-an-address",
+        ],
+    )
+    def test_check_smtp_exists_rejects_invalid(self, smtp_address: str) -> None:
+        """Test invalid SMTP addresses, including a trailing newline, are rejected."""
+        with pytest.raises(ValueError):
+            CommandBuilder().build_check_smtp_exists(smtp_address)
+
+    def test_custom_command_rejects_trailing_newline(self) -> None:
+        """Test a cmdlet name with a trailing newline is rejected."""
+        with pytest.raises(ValueError):
+            CommandBuilder().build_custom_command("Get-Mailbox\n")
+
+
+class TestPsParser:
+    """Tests for PowerShell output parsing."""
+
+    @pytest.mark.parametrize(
+        "value",
+        [123456789012345678901234567890, 2**64, -(2**63) - 1, 2**63 - 1],
+    )
+    def test_parse_wide_integer(self, value: int) -> None:
+        """Test integers at and beyond the 64-bit range are decoded exactly."""
+        parsed = parse_json_output(f'{{"TotalItemSizeBytes": {value}}}')
+        assert parsed == {"TotalItemSizeBytes": value}
+        assert type(parsed["TotalItemSizeBytes"]) is int
+
+
+class _Color(Enum):
+    RED = "red"
+
+
+@dataclass
+class _Point:
+    x: int
+    y: int
+
+
+class TestJSONFormatter:
+    """Tests for JSONFormatter."""
+
+    def test_output_independent_of_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a record formats the same with and without orjson."""
+        record = logging.LogRecord("test", logging.INFO, __file__, 1, "Café %s", ("ok",), None)
+        record.extra_data = {
+            "when": datetime(2024, 1, 2, 3, 4, 5),
+            "color": _Color.RED,
+            "point": _Point(1, 2),
+            "id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+            "ratio": float("nan"),
+            3: "row",
+        }
+        formatter = JSONFormatter()
+
+        with_orjson = formatter.format(record)
+        monkeypatch.setattr(app_logging, "orjson", None)
+        assert formatter.format(record) == with_orjson
+
+
+class TestLocalQueueHandler:
+    """Tests for the queue handler feeding the file log listener."""
+
+    def test_prepare_snapshots_record(self) -> None:
+        """Test queued records keep the logged values and hold no traceback frames."""
+        log_queue: queue.Queue[logging.LogRecord] = queue.Queue()
+        handler = app_logging._LocalQueueHandler(log_queue)
+        args = {"mailbox": "before"}
+        extra = {"batch": 1}
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            record = logging.LogRecord(
+                "test", logging.ERROR, __file__, 1, "Failed %(mailbox)s", (args,), sys.exc_info()
+            )
+        record.extra_data = extra
+
+        handler.handle(record)
+        args["mailbox"] = "after"
+        extra["batch"] = 2
+        queued = log_queue.get_nowait()
+
+        assert queued.getMessage() == "Failed before"
+        assert queued.extra_data == {"batch": 1}
+        assert queued.exc_info is None
+        assert "ValueError: boom" in queued.exc_text
+        assert "ValueError: boom" in JSONFormatter().format(queued)
+
+
+class TestJSONFileHandler:
+    """Tests for JSONFileHandler."""
+
+    @staticmethod
+    def _record(message: str) -> logging.LogRecord:
+        return logging.LogRecord("test", logging.INFO, __file__, 1, message, None, None)
+
+    def test_rollover(self, tmp_path: Path) -> None:
+        """Test the log file is rotated once it would exceed maxBytes."""
+        log_path = tmp_path / "app.log"
+        handler = JSONFileHandler(str(log_path), maxBytes=200, backupCount=1)
+        handler.setFormatter(JSONFormatter())
+        try:
+            for i in range(5):
+                handler.emit(self._record(f"message {i}"))
+        finally:
+            handler.close()
+
+        assert (tmp_path / "app.log.1").exists()
+        assert log_path.stat().st_size <= 200
+
+    def test_no_rollover_for_non_regular_file(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a non-regular file such as the null device is never rotated."""
+        handler = JSONFileHandler(os.devnull, maxBytes=1)
+        handler.setFormatter(JSONFormatter())
+        rollovers: list[None] = []
+        monkeypatch.setattr(handler, "doRollover", lambda: rollovers.append(None))
+        try:
+            handler.emit(self._record("message"))
+        finally:
+            handler.close()
+
+        assert rollovers == []